@@ -0,0 +1,118 @@
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing.util import Finalize
+from engine.disk_cache import DiskCache, DEFAULT_CACHE_DIR
+from engine.graph_file import load_graph
+from engine.input_model import InputModel
+from engine.output_model import OutputModel
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+
+worker_state = None
+
+
+def find_endpoints(engine):
+    inputs = [node for node in engine.nodes if isinstance(node, InputModel)]
+    outputs = [node for node in engine.nodes if isinstance(node, OutputModel) and node.input_node]
+    if len(inputs) != 1: raise ValueError(f"Batch graphs need exactly one Input node, found {len(inputs)}.")
+    if not outputs: raise ValueError("Batch graphs need a connected Output node.")
+    return inputs[0], outputs[0]
+
+
+def init_worker(graph_path, backend, cache_dir, cache_bytes):
+    global worker_state
+    engine = load_graph(graph_path)
+    engine.set_backend(backend)
+    engine.max_workers = 1
+    if cache_dir:
+        engine.set_disk_cache(DiskCache(cache_dir, cache_bytes))
+        engine.cache_final_only = True
+        Finalize(None, engine.disk_cache.flush, exitpriority=10)
+    worker_state = (engine,) + find_endpoints(engine)
+
+
+def process_file(input_path, output_path):
+    engine, source, output = worker_state
+    try:
+        if not source.load_image(input_path): return input_path, 0, "could not be opened"
+        if not output.stream_output(output_path):
+            image = output.render_output()
+            if image is None: return input_path, 0, "graph produced no image"
+            output.save_output(output_path, image)
+        return input_path, os.path.getsize(input_path), None
+    except Exception as e: return input_path, 0, str(e)
+
+
+def iter_inputs(pattern):
+    if os.path.isdir(pattern):
+        with os.scandir(pattern) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS): yield entry.path
+    else:
+        for path in glob.iglob(pattern):
+            if os.path.isfile(path): yield path
+
+
+def get_output_path(input_path, output_dir, extension):
+    stem, original_extension = os.path.splitext(os.path.basename(input_path))
+    return os.path.join(output_dir, stem + (extension or original_extension))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a saved node graph over a directory or glob of images.")
+    parser.add_argument("graph", help="Graph file saved from the editor.")
+    parser.add_argument("inputs", help="Input directory or glob pattern, e.g. 'photos/*.jpg'.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--format", help="Output extension such as .png or .jpg (default: keep the input extension).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-in-flight", type=int, help="Images queued or processing at once (default: 2 per worker).")
+    parser.add_argument("--backend", choices=["pil", "numpy"], default="pil")
+    parser.add_argument("--cache", action="store_true", help="Reuse cached results and cache each image's final result (off by default).")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for cached node outputs shared with the editor.")
+    parser.add_argument("--cache-size", type=int, default=2048, help="Disk cache budget in MB.")
+    args = parser.parse_args()
+
+    try: find_endpoints(load_graph(args.graph))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[ERROR] Could not load graph {args.graph}: {e}")
+        return 1
+    extension = args.format
+    if extension and not extension.startswith('.'): extension = '.' + extension
+    os.makedirs(args.output_dir, exist_ok=True)
+    max_in_flight = args.max_in_flight or args.workers * 2
+    cache_dir = args.cache_dir if args.cache else None
+    if cache_dir: os.makedirs(cache_dir, exist_ok=True)
+
+    processed = failed = bytes_read = 0
+    def collect(futures):
+        nonlocal processed, failed, bytes_read
+        for future in futures:
+            input_path, size, error = future.result()
+            if error:
+                failed += 1
+                print(f"[ERROR] {input_path}: {error}")
+            else:
+                processed += 1
+                bytes_read += size
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=(args.graph, args.backend, cache_dir, args.cache_size * 1024 * 1024)) as executor:
+        pending = set()
+        for input_path in iter_inputs(args.inputs):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(process_file, input_path, get_output_path(input_path, args.output_dir, extension)))
+        collect(wait(pending)[0])
+    elapsed = time.perf_counter() - start
+
+    print(f"[INFO] Processed {processed} images ({failed} failed) in {elapsed:.2f} s: {processed / elapsed:.1f} images/s, {bytes_read / elapsed / 1e6:.1f} MB/s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
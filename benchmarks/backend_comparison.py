@@ -0,0 +1,80 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import Image
+from engine import array_backend
+from engine.brightness_model import BrightnessModel
+from engine.contrast_model import ContrastModel
+from engine.blur_model import BlurModel
+from engine.splitter_model import SplitterModel
+from engine.threshold_model import ThresholdModel
+from engine.edge_model import EdgeModel
+
+
+class BenchmarkGraph:
+    def __init__(self):
+        self.render_scale = 1.0
+        self.needs_update = False
+        self.backend = "pil"
+
+    def request_update(self, interactive=False): pass
+
+
+def make_image(megapixels, mode, seed=0):
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = int(megapixels * 1e6 / width)
+    rng = np.random.default_rng(seed)
+    gradient = np.add.outer(np.linspace(0, 160, height), np.linspace(0, 90, width))
+    channels = [(gradient + rng.integers(0, 6, size=gradient.shape) + 30 * index) % 256 for index in range(len(mode))]
+    return Image.fromarray(np.dstack(channels).astype(np.uint8).squeeze(), mode)
+
+
+def make_cases(graph):
+    brightness = BrightnessModel(graph, 0, 0)
+    brightness.brightness_factor = 1.3
+    contrast = ContrastModel(graph, 0, 0)
+    contrast.contrast_factor = 1.6
+    blur = BlurModel(graph, 0, 0)
+    blur.blur_radius = 5.0
+    splitter = SplitterModel(graph, 0, 0)
+    splitter.output_mode = "Green"
+    threshold = ThresholdModel(graph, 0, 0)
+    edges = EdgeModel(graph, 0, 0)
+    edges_overlay = EdgeModel(graph, 0, 0)
+    edges_overlay.overlay = True
+    return [("Brightness", brightness), ("Contrast", contrast), ("Blur r=5", blur), ("Splitter", splitter), ("Threshold", threshold), ("Edge Detect", edges), ("Edge Detect + overlay", edges_overlay)]
+
+
+def best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the PIL and NumPy kernels of every built-in node.")
+    parser.add_argument("--megapixels", type=float, default=12.0)
+    parser.add_argument("--mode", default="RGB", choices=array_backend.ARRAY_MODES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    image = make_image(args.megapixels, args.mode)
+    array = array_backend.to_array(image)
+    print(f"{image.size[0]}x{image.size[1]} {args.mode}, best of {args.repeat}")
+    print(f"{'Node':<24}{'PIL (ms)':>10}{'NumPy (ms)':>12}{'Speedup':>9}")
+    for name, node in make_cases(BenchmarkGraph()):
+        pil_time = best_time(lambda: node.apply(image), args.repeat)
+        array_time = best_time(lambda: node.apply_array(array), args.repeat)
+        print(f"{name:<24}{pil_time * 1000:>10.1f}{array_time * 1000:>12.1f}{pil_time / array_time:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import ImageFilter
+from backend_comparison import make_image
+from engine.blur_model import BlurModel, fast_gaussian_blur
+from engine.graph_engine import GraphEngine
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def compare(image, radius, repeat):
+    blur = BlurModel(GraphEngine())
+    factor = blur.get_reduction(radius, image.size)
+    exact_ms, exact = best_time(lambda: image.filter(ImageFilter.GaussianBlur(radius=radius)), repeat)
+    if factor == 1: return {"factor": 1, "exact_ms": exact_ms, "fast_ms": exact_ms, "max_error": 0, "interior_error": 0, "mean_error": 0.0}
+
+    fast_ms, fast = best_time(lambda: fast_gaussian_blur(image, radius, factor), repeat)
+    error = np.abs(np.asarray(exact, dtype=np.int16) - np.asarray(fast, dtype=np.int16))
+    margin = math.ceil(3 * radius)
+    interior = error[margin:-margin, margin:-margin]
+    return {"factor": factor, "exact_ms": exact_ms, "fast_ms": fast_ms, "max_error": int(error.max()), "interior_error": int(interior.max()) if interior.size else None, "mean_error": float(error.mean())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the exact Gaussian blur with the reduced-resolution fast path for a range of radii.")
+    parser.add_argument("--size", type=float, default=12, help="Image size in megapixels.")
+    parser.add_argument("--mode", default="RGB", choices=["L", "RGB", "RGBA"])
+    parser.add_argument("--radii", type=float, nargs="+", default=[2, 5, 10, 20, 50, 100, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    image = make_image(args.size, args.mode)
+    print(f"{image.width}x{image.height} {args.mode}, best of {args.repeat}. Errors are absolute 8-bit levels; interior excludes a 3-radius border.")
+    print(f"{'Radius':>8}{'Factor':>8}{'Exact':>11}{'Fast':>11}{'Speedup':>9}{'Max err':>9}{'Interior':>10}{'Mean err':>10}")
+    for radius in args.radii:
+        result = compare(image, radius, args.repeat)
+        interior = "-" if result["interior_error"] is None else result["interior_error"]
+        print(f"{radius:>8g}{result['factor']:>8}{result['exact_ms']:>9.1f}ms{result['fast_ms']:>9.1f}ms{result['exact_ms'] / result['fast_ms']:>8.1f}x{result['max_error']:>9}{interior:>10}{result['mean_error']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+from engine import array_backend
+
+
+def make_photo(megapixels, noise, seed=0):
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = int(megapixels * 1e6 / width)
+    rng = np.random.default_rng(seed)
+    image = Image.new("L", (width, height), 90)
+    draw = ImageDraw.Draw(image)
+    for _ in range(400):
+        x, y, radius = rng.integers(0, width), rng.integers(0, height), rng.integers(20, width // 8)
+        shape = draw.ellipse if rng.integers(0, 2) else draw.rectangle
+        shape((x - radius, y - radius, x + radius, y + radius * rng.uniform(0.3, 1.5)), fill=int(rng.integers(0, 256)))
+    gray = np.asarray(image.filter(ImageFilter.GaussianBlur(2)), dtype=np.float32)
+    if noise: gray = gray + rng.normal(0, noise, gray.shape).astype(np.float32)
+    return np.clip(gray, 0, 255).astype(np.uint8)
+
+
+def make_uniform_noise(megapixels, seed=0):
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    return np.random.default_rng(seed).integers(0, 256, (int(megapixels * 1e6 / width), width), dtype=np.uint8)
+
+
+def reference_canny(gray, low, high):
+    low, high = sorted((max(0, low), max(0, high)))
+    gx, gy = array_backend.sobel(gray)
+    gx, gy = gx.astype(np.int32), gy.astype(np.int32)
+    magnitude = np.abs(gx) + np.abs(gy)
+    height, width = gray.shape
+    def neighbor(dy, dx): return magnitude[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+    x, y, value = gx[1:-1, 1:-1], gy[1:-1, 1:-1], magnitude[1:-1, 1:-1]
+    ax, ay = np.abs(x), np.abs(y)
+    diagonal = (ay * 12 >= ax * 5) & (ay * 5 <= ax * 12)
+    vertical = ~diagonal & (ay * 5 > ax * 12)
+    horizontal = ~diagonal & ~vertical
+    same_sign = (x ^ y) >= 0
+    keep = horizontal & (value > neighbor(0, -1)) & (value >= neighbor(0, 1))
+    keep |= vertical & (value > neighbor(-1, 0)) & (value >= neighbor(1, 0))
+    keep |= diagonal & same_sign & (value > neighbor(-1, -1)) & (value >= neighbor(1, 1))
+    keep |= diagonal & ~same_sign & (value > neighbor(-1, 1)) & (value >= neighbor(1, -1))
+    weak = keep & (value > low)
+
+    edges = weak & (value > high)
+    while True:
+        padded = np.pad(edges, 1)
+        grown = edges.copy()
+        for dy in (0, 1, 2):
+            for dx in (0, 1, 2): grown |= padded[dy:dy + height, dx:dx + width]
+        grown &= weak
+        if np.array_equal(grown, edges): break
+        edges = grown
+    return edges.astype(np.uint8) * 255
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def time_stages(gray, low, high, repeat):
+    sobel_ms, (gx, gy) = best_time(lambda: array_backend.sobel(gray), repeat)
+    magnitude = np.abs(gx)
+    magnitude += np.abs(gy)
+    nms_ms, pixels = best_time(lambda: array_backend.non_max_suppression(magnitude, gx, gy, low), repeat)
+    label_ms, _ = best_time(lambda: array_backend.hysteresis(pixels, magnitude, high), repeat)
+    total_ms, _ = best_time(lambda: array_backend.canny(gray, low, high), repeat)
+    return sobel_ms, nms_ms, label_ms, total_ms, pixels.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time NumPy Canny edge detection on noisy images and check it against a brute-force reference.")
+    parser.add_argument("--size", type=float, default=24, help="Image size in megapixels.")
+    parser.add_argument("--check-size", type=float, default=2, help="Image size in megapixels for the reference check.")
+    parser.add_argument("--noise", type=float, nargs="+", default=[0, 3, 6, 12], help="Gaussian noise levels added to the synthetic photo.")
+    parser.add_argument("--low", type=int, default=50)
+    parser.add_argument("--high", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [(f"photo, noise {noise:g}", lambda size, noise=noise: make_photo(size, noise)) for noise in args.noise]
+    cases.append(("uniform noise", make_uniform_noise))
+
+    print(f"{args.size:g} MP, thresholds {args.low}/{args.high}, best of {args.repeat}. Reference check on {args.check_size:g} MP.")
+    print(f"{'Input':<18}{'Weak px':>11}{'Sobel':>10}{'NMS':>10}{'Hysteresis':>12}{'Total':>10}{'Matches':>9}")
+    for name, make in cases:
+        sobel_ms, nms_ms, label_ms, total_ms, weak = time_stages(make(args.size), args.low, args.high, args.repeat)
+        check = make(args.check_size)
+        matches = np.array_equal(array_backend.canny(check, args.low, args.high), reference_canny(check, args.low, args.high))
+        print(f"{name:<18}{weak:>11}{sobel_ms:>8.0f}ms{nms_ms:>8.0f}ms{label_ms:>10.0f}ms{total_ms:>8.0f}ms{str(matches):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spatial_index import SpatialIndex
+from nodes.base_node import BaseNode
+
+
+class BenchmarkGraph:
+    def __init__(self):
+        self.render_scale = 1.0
+        self.needs_update = False
+        self.backend = "pil"
+
+    def request_update(self, interactive=False): pass
+
+
+def make_nodes(node_count, seed=0):
+    rng = random.Random(seed)
+    graph = BenchmarkGraph()
+    extent = max(2000, int((node_count * 200 * 160) ** 0.5))
+    nodes = []
+    for _ in range(node_count):
+        node = BaseNode(graph, "Node", rng.uniform(0, extent), rng.uniform(0, extent))
+        node.input_connector = node.output_connector = True
+        nodes.append(node)
+    return nodes, extent
+
+
+def linear_find_node_at(nodes, x, y):
+    for node in reversed(nodes):
+        if node.is_within(x, y): return node
+    return None
+
+
+def indexed_find_node_at(index, x, y):
+    for node in index.query_point(x, y):
+        if node.is_within(x, y): return node
+    return None
+
+
+def time_per_click(function, clicks):
+    start = time.perf_counter()
+    for x, y in clicks: function(x, y)
+    return (time.perf_counter() - start) / len(clicks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare click hit-testing latency of a linear node scan and the spatial index.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--clicks", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'Nodes':>7}{'Linear (us)':>13}{'Indexed (us)':>14}{'Drag update (us)':>18}{'Same hits':>11}")
+    for node_count in args.sizes:
+        nodes, extent = make_nodes(node_count)
+        index = SpatialIndex()
+        for node in nodes: index.insert(node, node.get_bounds())
+
+        rng = random.Random(1)
+        clicks = [(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in range(args.clicks)]
+        linear_time = time_per_click(lambda x, y: linear_find_node_at(nodes, x, y), clicks)
+        indexed_time = time_per_click(lambda x, y: indexed_find_node_at(index, x, y), clicks)
+        same_hits = all(linear_find_node_at(nodes, x, y) is indexed_find_node_at(index, x, y) for x, y in clicks)
+
+        dragged = nodes[len(nodes) // 2]
+        start = time.perf_counter()
+        for step in range(args.clicks):
+            dragged.x += 1
+            index.update(dragged, dragged.get_bounds())
+        drag_time = (time.perf_counter() - start) / args.clicks
+        print(f"{node_count:>7}{linear_time * 1e6:>13.1f}{indexed_time * 1e6:>14.2f}{drag_time * 1e6:>18.2f}{str(same_hits):>11}")
+
+
+if __name__ == "__main__":
+    main()
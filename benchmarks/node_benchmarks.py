@@ -0,0 +1,144 @@
+import argparse
+import ctypes
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import PIL
+from engine import array_backend
+from backend_comparison import make_image
+from engine.graph_engine import GraphEngine
+from engine.splitter_model import SplitterModel
+
+BLUR_RADII = (1.0, 5.0, 20.0, 100.0)
+
+
+def make_cases():
+    cases = [("Brightness", "Brightness", {"brightness_factor": 1.3}), ("Contrast", "Contrast", {"contrast_factor": 1.6})]
+    cases += [(f"Blur r={radius:g}", "Blur", {"blur_radius": radius}) for radius in BLUR_RADII]
+    cases += [(f"Splitter {mode}", "Splitter", {"output_mode": mode}) for mode in SplitterModel.MODES]
+    cases += [("Threshold", "Threshold", {"threshold_value": 128}), ("Threshold Otsu", "Threshold", {"method": "Otsu"})]
+    cases += [(f"{method} b={size}", "Threshold", {"method": method, "block_size": size}) for method in ("Adaptive Mean", "Adaptive Gaussian") for size in (11, 51)]
+    cases += [("Edge Detect", "Edge Detect", {}), ("Edge Detect + overlay", "Edge Detect", {"overlay": True}), ("Edge Detect Canny", "Edge Detect", {"method": "Canny"})]
+    return cases
+
+
+def read_memory_status():
+    status = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                name, value = line.split(":")
+                status[name] = int(value.split()[0]) * 1024
+    return status
+
+def rss_available():
+    try:
+        with open("/proc/self/clear_refs", "w") as f: f.write("5")
+        return "VmHWM" in read_memory_status()
+    except OSError: return False
+
+def release_free_memory():
+    gc.collect()
+    try: ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError): pass
+
+def measure_peak(function, use_rss):
+    release_free_memory()
+    if use_rss:
+        with open("/proc/self/clear_refs", "w") as f: f.write("5")
+        baseline = read_memory_status()["VmRSS"]
+        function()
+        return read_memory_status()["VmHWM"] - baseline
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+
+def run_case(engine, source, node_type, params, repeat, use_rss):
+    node = engine.add_node(node_type, params=params)
+    engine.connect(source, node)
+    peak = measure_peak(node.process, use_rss)
+    times = []
+    for _ in range(repeat):
+        node.output_data = None
+        start = time.perf_counter()
+        node.process()
+        times.append(time.perf_counter() - start)
+    output_size = array_backend.get_size(node.output_data) if array_backend.is_image(node.output_data) else None
+    engine.remove_node(node)
+    return {"best_ms": min(times) * 1000, "mean_ms": sum(times) / len(times) * 1000, "peak_mb": peak / 1e6, "output_size": output_size}
+
+
+def run_benchmarks(sizes, modes, repeat, backend, name_filter=None):
+    use_rss = rss_available()
+    engine = GraphEngine()
+    engine.set_backend(backend)
+    source = engine.add_node("Input")
+    results = {}
+    for megapixels in sizes:
+        for mode in modes:
+            image = make_image(megapixels, mode)
+            source.output_data = array_backend.to_array(image) if backend == "numpy" else image
+            for name, node_type, params in make_cases():
+                if name_filter and name_filter.lower() not in name.lower(): continue
+                key = f"{name} | {megapixels:g} MP | {mode}"
+                results[key] = run_case(engine, source, node_type, params, repeat, use_rss)
+                print(f"{key:<40}{results[key]['best_ms']:>10.1f} ms{results[key]['peak_mb']:>10.1f} MB")
+            source.output_data = image = None
+    meta = {"python": platform.python_version(), "pillow": PIL.__version__, "numpy": np.__version__, "platform": platform.platform(), "backend": backend, "repeat": repeat, "memory": "peak RSS" if use_rss else "tracemalloc", "date": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+
+def compare(report, baseline, threshold):
+    regressions = []
+    print(f"\n{'Case':<40}{'Baseline':>10}{'Now':>10}{'Change':>9}{'Memory':>9}")
+    for key, result in report["results"].items():
+        old = baseline["results"].get(key)
+        if not old: continue
+        time_change = (result["best_ms"] / old["best_ms"] - 1) * 100 if old["best_ms"] else 0.0
+        memory_change = (result["peak_mb"] / old["peak_mb"] - 1) * 100 if old["peak_mb"] > 0.5 else 0.0
+        flag = "  REGRESSION" if time_change > threshold or memory_change > threshold else ""
+        if flag: regressions.append(key)
+        print(f"{key:<40}{old['best_ms']:>8.1f}ms{result['best_ms']:>8.1f}ms{time_change:>+8.1f}%{memory_change:>+8.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every node's process() on synthetic images and compare against a stored baseline.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 12, 50], help="Image sizes in megapixels.")
+    parser.add_argument("--modes", nargs="+", default=list(array_backend.ARRAY_MODES), choices=array_backend.ARRAY_MODES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backend", choices=["pil", "numpy"], default="pil")
+    parser.add_argument("--filter", help="Only run cases whose name contains this text.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="JSON results to compare against.")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Flag cases that got slower or use more memory by more than this percentage.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.modes, args.repeat, args.backend, args.filter)
+    if args.output:
+        with open(args.output, "w") as f: json.dump(report, f, indent=2)
+    if not args.baseline: return 0
+
+    with open(args.baseline) as f: baseline = json.load(f)
+    if baseline["meta"].get("backend") != report["meta"]["backend"]: print(f"[WARN] Baseline was recorded with the {baseline['meta'].get('backend')} backend.")
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n[ERROR] {len(regressions)} case(s) regressed by more than {args.threshold:g}%.")
+        return 1
+    print(f"\n[INFO] No regressions above {args.threshold:g}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
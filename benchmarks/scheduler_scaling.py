@@ -0,0 +1,93 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.scheduler import ExecutionScheduler
+
+
+class BenchmarkNode:
+    def __init__(self, index, x, y):
+        self.node_type = f"Node {index}"
+        self.x = x
+        self.y = y
+        self.input_node = None
+
+
+def make_graph(node_count, seed=0):
+    rng = random.Random(seed)
+    nodes = [BenchmarkNode(index, rng.uniform(0, 20000), rng.uniform(0, 20000)) for index in range(node_count)]
+    edges = []
+    for index, node in enumerate(nodes[1:], start=1):
+        if rng.random() < 0.9:
+            node.input_node = nodes[rng.randrange(max(0, index - 50), index)]
+            edges.append((node.input_node, node))
+    return nodes, edges
+
+
+def legacy_execution_order(nodes):
+    in_degree = {node: 0 for node in nodes}
+    for node in nodes:
+        if node.input_node: in_degree[node] += 1
+
+    queue = [node for node in nodes if in_degree[node] == 0]
+    result = []
+    while queue:
+        queue.sort(key=lambda n: (n.y, n.x))
+        node = queue.pop(0)
+        result.append(node)
+        neighbors = [potential_neighbor for potential_neighbor in nodes if potential_neighbor.input_node == node]
+        neighbors.sort(key=lambda n: (n.y, n.x))
+        for neighbor in neighbors:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0: queue.append(neighbor)
+    return result
+
+
+def best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how execution ordering scales with graph size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 2500, 5000, 10000])
+    parser.add_argument("--legacy-limit", type=int, default=5000, help="skip the quadratic legacy ordering above this many nodes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Nodes':>7}{'Legacy (ms)':>13}{'Heap (ms)':>11}{'Edit+order (ms)':>17}{'Same order':>12}")
+    for node_count in args.sizes:
+        nodes, edges = make_graph(node_count)
+        scheduler = ExecutionScheduler()
+        for node in nodes: scheduler.add_node(node)
+        for source, target in edges: scheduler.add_edge(source, target)
+
+        def order_from_scratch():
+            scheduler.invalidate()
+            return scheduler.get_execution_order()
+
+        def relink_and_order():
+            source, target = edges[len(edges) // 2]
+            scheduler.remove_edge(source, target)
+            scheduler.add_edge(source, target)
+            return scheduler.get_execution_order()
+
+        heap_time = best_time(order_from_scratch, args.repeat)
+        edit_time = best_time(relink_and_order, args.repeat)
+        if node_count <= args.legacy_limit:
+            legacy_time = best_time(lambda: legacy_execution_order(nodes), 1)
+            same_order = legacy_execution_order(nodes) == order_from_scratch()
+            print(f"{node_count:>7}{legacy_time * 1000:>13.1f}{heap_time * 1000:>11.2f}{edit_time * 1000:>17.2f}{str(same_order):>12}")
+        else: print(f"{node_count:>7}{'-':>13}{heap_time * 1000:>11.2f}{edit_time * 1000:>17.2f}{'-':>12}")
+
+
+if __name__ == "__main__":
+    main()
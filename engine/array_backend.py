@@ -0,0 +1,242 @@
+import importlib.util
+import sys
+from PIL import Image
+
+AVAILABLE = importlib.util.find_spec("numpy") is not None
+ARRAY_MODES = ('L', 'RGB', 'RGBA')
+
+
+class LazyNumPy:
+    def __getattr__(self, name): return getattr(load_numpy(), name)
+
+np = LazyNumPy()
+
+def load_numpy():
+    global np
+    if isinstance(np, LazyNumPy):
+        if not AVAILABLE: raise ImportError("NumPy is not installed.")
+        import numpy
+        np = numpy
+    return np
+
+def is_array(data):
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(data, numpy.ndarray)
+
+def is_image(data): return isinstance(data, Image.Image) or is_array(data)
+
+def get_mode(data):
+    if not is_array(data): return data.mode
+    if data.ndim == 2: return 'L'
+    return {3: 'RGB', 4: 'RGBA'}.get(data.shape[2])
+
+def get_size(data):
+    if not is_array(data): return data.size
+    return data.shape[1], data.shape[0]
+
+
+def to_uint8(array):
+    if array.dtype == np.uint8: return array
+    if array.dtype.kind == 'u': return (array >> (8 * (array.dtype.itemsize - 1))).astype(np.uint8)
+    if array.dtype.kind == 'i': return (np.clip(array, 0, 65535) >> 8).astype(np.uint8)
+    return (np.clip(array, 0.0, 1.0) * 255).round().astype(np.uint8)
+
+def to_array(image):
+    if is_array(image): return image
+    if image.mode == 'F' or image.mode.startswith('I'): array = to_uint8(np.asarray(image))
+    else:
+        if image.mode not in ARRAY_MODES:
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else ('L' if image.mode == '1' else 'RGB'))
+        array = np.asarray(image)
+    array.flags.writeable = False
+    return array
+
+def to_pil(data):
+    if not is_array(data): return data
+    return Image.fromarray(np.ascontiguousarray(data), get_mode(data))
+
+
+def to_gray(array):
+    if array.ndim == 2: return array
+    return np.asarray(to_pil(array).convert('L'))
+
+def to_rgb(array):
+    if array.ndim == 2: return np.repeat(array[..., None], 3, axis=2)
+    return array[..., :3]
+
+def convert(data, mode):
+    if not is_array(data): return data.convert(mode)
+    if mode == get_mode(data): return data
+    if mode == 'L': return to_gray(data)
+    if mode == 'RGB': return to_rgb(data)
+    raise ValueError(f"Unsupported array conversion to {mode}")
+
+
+def luma_histogram(array): return to_pil(to_gray(array)).histogram()
+
+def apply_lut(array, lut):
+    tables = np.asarray(lut, dtype=np.uint8)
+    if array.ndim == 2: return np.take(tables[0], array)
+    if (tables == tables[0]).all(): return np.take(tables[0], array)
+    output = np.empty_like(array)
+    for channel in range(array.shape[2]): np.take(tables[channel], array[..., channel], out=output[..., channel])
+    return output
+
+def threshold(gray, value): return np.where(gray > value, np.uint8(255), np.uint8(0))
+
+def _axis_slice(axis, start, stop): return (slice(None),) * axis + (slice(start, stop),)
+
+def box_sums(array, size, axis):
+    shape = list(array.shape)
+    shape[axis] += 1
+    sums = np.zeros(shape, dtype=np.int32 if max(array.shape) * size * 255 < 2 ** 31 else np.int64)
+    np.cumsum(array, axis=axis, out=sums[_axis_slice(axis, 1, None)])
+    return sums[_axis_slice(axis, size, None)] - sums[_axis_slice(axis, None, -size)]
+
+def box_mean(gray, size):
+    radius = size // 2
+    area = size * size
+    padded = np.pad(gray, radius, mode='edge')
+    total = box_sums(box_sums(padded, size, 1), size, 0)
+    total += area // 2
+    total //= area
+    return total.astype(np.uint8)
+
+def adaptive_threshold(gray, mean, offset): return np.where(gray.astype(np.int16) > mean.astype(np.int16) - offset, np.uint8(255), np.uint8(0))
+
+def get_channel(array, index):
+    if array.ndim == 2: return array
+    return array[..., index]
+
+def blank(size): return np.zeros((size[1], size[0]), dtype=np.uint8)
+
+def overlay_edges(array, edges, color=(255, 0, 0)):
+    overlay = np.array(to_rgb(array))
+    overlay[edges > 0] = color
+    return overlay
+
+
+def find_edges(gray):
+    if gray.shape[0] < 3 or gray.shape[1] < 3: return gray.copy()
+    source = gray.astype(np.int16)
+    response = source[1:-1, 1:-1] * 8
+    for rows, columns in ((slice(None, -2), slice(None, -2)), (slice(None, -2), slice(1, -1)), (slice(None, -2), slice(2, None)), (slice(1, -1), slice(None, -2)), (slice(1, -1), slice(2, None)), (slice(2, None), slice(None, -2)), (slice(2, None), slice(1, -1)), (slice(2, None), slice(2, None))): response -= source[rows, columns]
+    np.clip(response, 0, 255, out=response)
+    edges = np.array(gray)
+    edges[1:-1, 1:-1] = response
+    return edges
+
+
+def sobel(gray):
+    height, width = gray.shape
+    source = np.pad(gray, 1, mode='edge').astype(np.int16)
+    gx = np.zeros((height + 2, width + 2), dtype=np.int16)
+    gy = np.zeros_like(gx)
+    inner_x, inner_y = gx[1:-1, 1:-1], gy[1:-1, 1:-1]
+    dx = source[:, 2:] - source[:, :-2]
+    np.add(dx[:-2], dx[2:], out=inner_x)
+    inner_x += dx[1:-1]
+    inner_x += dx[1:-1]
+    sy = source[:, :-2] + source[:, 2:]
+    sy += source[:, 1:-1]
+    sy += source[:, 1:-1]
+    np.subtract(sy[2:], sy[:-2], out=inner_y)
+    return gx, gy
+
+def dense_non_max_suppression(magnitude, gx, gy, candidates):
+    height, width = magnitude.shape
+    def neighbor(dy, dx): return magnitude[1 + dy:height - 1 + dy, 1 + dx:width - 1 + dx]
+    def is_peak(before, after): return (value > neighbor(*before)) & (value >= neighbor(*after))
+    value, x, y = magnitude[1:-1, 1:-1], gx[1:-1, 1:-1], gy[1:-1, 1:-1]
+    ax, ay = np.abs(x), np.abs(y)
+    steep = ay * 5 > ax * 12
+    diagonal = ay * 12 >= ax * 5
+    diagonal &= ~steep
+    peaks = np.where(steep, is_peak((-1, 0), (1, 0)), is_peak((0, -1), (0, 1)))
+    peaks = np.where(diagonal, np.where((x ^ y) < 0, is_peak((-1, 1), (1, -1)), is_peak((-1, -1), (1, 1))), peaks)
+    keep = np.zeros(magnitude.shape, dtype=bool)
+    np.logical_and(peaks, candidates[1:-1, 1:-1], out=keep[1:-1, 1:-1])
+    return np.flatnonzero(keep).astype(np.int32)
+
+def non_max_suppression(magnitude, gx, gy, low):
+    stride = np.int32(magnitude.shape[1])
+    flat = magnitude.ravel()
+    candidates = magnitude > low
+    if np.count_nonzero(candidates) * 4 > flat.size: return dense_non_max_suppression(magnitude, gx, gy, candidates)
+    candidates = np.flatnonzero(candidates).astype(np.int32)
+    value = flat[candidates]
+    x, y = gx.ravel()[candidates], gy.ravel()[candidates]
+    ax, ay = np.abs(x), np.abs(y)
+    offset = np.where(ay * 5 > ax * 12, stride, np.int32(1))
+    diagonal = np.flatnonzero((ay * 12 >= ax * 5) & (ay * 5 <= ax * 12))
+    offset[diagonal] = np.where((x[diagonal] ^ y[diagonal]) < 0, stride - 1, stride + 1)
+    keep = value > flat[candidates - offset]
+    keep &= value >= flat[candidates + offset]
+    return candidates[keep]
+
+def find_roots(parent, nodes):
+    roots = parent[nodes]
+    while True:
+        above = parent[roots]
+        moved = np.flatnonzero(above != roots)
+        if not moved.size: return roots
+        roots[moved] = above[moved]
+
+def compress_paths(parent, nodes):
+    while nodes.size:
+        above = parent[nodes]
+        grandparent = parent[above]
+        moved = np.flatnonzero(grandparent != above)
+        nodes = nodes[moved]
+        parent[nodes] = grandparent[moved]
+
+def label_runs(pixels, size, stride):
+    run_start = np.empty(pixels.size, dtype=bool)
+    run_start[:1] = True
+    np.not_equal(pixels[1:] - pixels[:-1], 1, out=run_start[1:])
+    run_of = np.cumsum(run_start, dtype=np.int32)
+    run_of -= 1
+    starts = np.flatnonzero(run_start)
+    firsts, lasts = pixels[starts], pixels[np.append(starts[1:], pixels.size) - 1]
+    runs = np.arange(firsts.size, dtype=np.int32)
+
+    run_map = np.full(size, -1, dtype=np.int32)
+    run_map[pixels] = run_of
+    sources, targets = [], []
+    for source, neighbors in ((run_of, pixels + stride), (runs, firsts + (stride - 1)), (runs, lasts + (stride + 1))):
+        target = run_map[neighbors]
+        linked = np.flatnonzero(target >= 0)
+        sources.append(source[linked])
+        targets.append(target[linked])
+    del run_map
+    first, second = np.concatenate(sources), np.concatenate(targets)
+
+    parent = runs.copy()
+    root_first, root_second = first, second
+    while first.size:
+        hooked = np.maximum(root_first, root_second)
+        parent[hooked] = np.minimum(root_first, root_second)
+        compress_paths(parent, hooked)
+        root_first, root_second = find_roots(parent, first), find_roots(parent, second)
+        differ = np.flatnonzero(root_first != root_second)
+        first, second, root_first, root_second = first[differ], second[differ], root_first[differ], root_second[differ]
+    return run_of, find_roots(parent, runs)
+
+def hysteresis(pixels, magnitude, high):
+    if not pixels.size: return pixels
+    run_of, roots = label_runs(pixels, magnitude.size, magnitude.shape[1])
+    strong = np.zeros(roots.size, dtype=bool)
+    strong[roots[run_of[magnitude.ravel()[pixels] > high]]] = True
+    return pixels[strong[roots][run_of]]
+
+def canny(gray, low, high):
+    low, high = sorted((max(0, low), max(0, high)))
+    gx, gy = sobel(gray)
+    magnitude = np.abs(gx)
+    magnitude += np.abs(gy)
+    pixels = non_max_suppression(magnitude, gx, gy, low)
+    del gx, gy
+    edges = np.zeros(magnitude.shape, dtype=np.uint8)
+    edges.ravel()[hysteresis(pixels, magnitude, high)] = 255
+    return np.ascontiguousarray(edges[1:-1, 1:-1])
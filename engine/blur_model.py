@@ -0,0 +1,57 @@
+import math
+from engine import array_backend
+from engine.node_model import NodeModel
+from PIL import Image, ImageFilter
+
+
+def fast_gaussian_blur(image, radius, factor):
+    if image.mode in ('LA', 'RGBA'): return Image.merge(image.mode, [fast_gaussian_blur(band, radius, factor) for band in image.split()])
+    sigma = math.sqrt(max(radius * radius - (factor * factor - 1) / 12 - factor * factor / 6, 0.0)) / factor
+    small = image.reduce(factor).filter(ImageFilter.GaussianBlur(radius=sigma))
+    return small.resize((small.width * factor, small.height * factor), Image.Resampling.BILINEAR).crop((0, 0) + image.size)
+
+
+class BlurModel(NodeModel):
+    params = ('blur_radius',)
+    kernel_version = 3
+    fast_min_pixels = 1_000_000
+    fast_min_sigma = 4.0
+    fast_min_factor = 4
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Blur", x, y)
+        self.blur_radius = 0.0
+        self.height = 130 
+
+    def process(self):
+        super().process() 
+        if array_backend.is_image(self.input_data):
+            if self.blur_radius > 1e-6: 
+                try: self.output_data = self.run_kernel(self.input_data)
+                except Exception as e: self.output_data = self.input_data 
+            else: self.output_data = self.input_data
+        else: self.output_data = None
+
+    def get_scaled_radius(self): return max(0, self.blur_radius) * self.node_graph.render_scale
+
+    def get_halo(self):
+        radius = self.get_scaled_radius()
+        if radius <= 1e-6: return 0
+        return math.ceil(3 * radius) + 3 + 5 * self.get_reduction(radius, (math.inf, math.inf))
+
+    def get_tile_grid(self, size): return self.get_reduction(self.get_scaled_radius(), size)
+
+    def get_reduction(self, radius, size):
+        if size[0] * size[1] < self.fast_min_pixels: return 1
+        factor = 1
+        while radius / (2 * factor) >= self.fast_min_sigma and min(size) >= 16 * factor: factor *= 2
+        return factor if factor >= self.fast_min_factor else 1
+
+    def apply(self, image, stats=None): return self.apply_tile(image, stats, image.size)
+
+    def apply_tile(self, image, stats, size):
+        radius = self.get_scaled_radius()
+        if radius <= 1e-6: return image
+        factor = self.get_reduction(radius, size)
+        if factor > 1: return fast_gaussian_blur(image, radius, factor)
+        return image.filter(ImageFilter.GaussianBlur(radius=radius))
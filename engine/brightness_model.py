@@ -0,0 +1,33 @@
+from engine import array_backend
+from engine.node_model import NodeModel
+from engine.point_ops import POINT_MODES, get_node_lut, lut_from_kernel, apply_lut
+from PIL import ImageEnhance
+
+class BrightnessModel(NodeModel):
+    params = ('brightness_factor',)
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Brightness", x, y)
+        self.brightness_factor = 1.0
+        self.height = 130 
+
+    def process(self):
+        super().process() 
+        if array_backend.is_image(self.input_data):
+            try: self.output_data = self.run_kernel(self.input_data)
+            except Exception as e:self.output_data = self.input_data
+        else: self.output_data = None
+
+    def get_point_mode(self, mode): return mode if mode in POINT_MODES else None
+
+    def get_lut(self, mode, stats=None): return lut_from_kernel(self.enhance, mode)
+
+    def enhance(self, image, stats=None):
+        enhancer = ImageEnhance.Brightness(image)
+        return enhancer.enhance(self.brightness_factor)
+
+    def apply(self, image, stats=None):
+        if image.mode not in POINT_MODES: return self.enhance(image)
+        return apply_lut(image, self.get_lut(image.mode))
+
+    def apply_array(self, array, stats=None): return array_backend.apply_lut(array, get_node_lut(self, array_backend.get_mode(array)))
@@ -0,0 +1,45 @@
+from engine import array_backend
+from engine.node_model import NodeModel
+from engine.point_ops import POINT_MODES, get_node_lut, lut_from_kernel, apply_lut
+from PIL import ImageEnhance, Image, ImageStat
+
+class ContrastModel(NodeModel):
+    params = ('contrast_factor',)
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Contrast", x, y)
+        self.contrast_factor = 1.0
+        self.height = 130 
+
+    def process(self):
+        super().process() 
+        if array_backend.is_image(self.input_data):
+            try: self.output_data = self.run_kernel(self.input_data)
+            except Exception as e:self.output_data = self.input_data 
+        else: self.output_data = None
+
+    def needs_stats(self): return True
+
+    def get_point_mode(self, mode): return mode if mode in POINT_MODES else None
+
+    def get_lut(self, mode, stats=None): return lut_from_kernel(self.enhance, mode, stats)
+
+    def enhance(self, image, stats=None):
+        if stats is None:
+            enhancer = ImageEnhance.Contrast(image)
+            return enhancer.enhance(self.contrast_factor)
+
+        mean = int(ImageStat.Stat(stats).mean[0] + 0.5)
+        degenerate = Image.new('L', image.size, mean)
+        if degenerate.mode != image.mode: degenerate = degenerate.convert(image.mode)
+        if 'A' in image.getbands(): degenerate.putalpha(image.getchannel('A'))
+        return Image.blend(degenerate, image, self.contrast_factor)
+
+    def apply(self, image, stats=None):
+        if image.mode not in POINT_MODES: return self.enhance(image, stats)
+        if stats is None: stats = self.collect_stats(image, None)
+        return apply_lut(image, self.get_lut(image.mode, stats))
+
+    def apply_array(self, array, stats=None):
+        if stats is None: stats = array_backend.luma_histogram(array)
+        return array_backend.apply_lut(array, get_node_lut(self, array_backend.get_mode(array), stats))
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import queue
+import threading
+import zlib
+from collections import OrderedDict
+from PIL import Image
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nodefusion")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+DEFAULT_MAX_PENDING_BYTES = 512 * 1024 ** 2
+COMPRESSION_LEVEL = 1
+CACHE_MODES = ('1', 'L', 'LA', 'RGB', 'RGBA', 'I', 'F')
+FILE_SUFFIX = ".img"
+
+
+def make_key(*parts): return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""): digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 8
+        self.max_pending_bytes = DEFAULT_MAX_PENDING_BYTES
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.pending = {}
+        self.pending_bytes = 0
+        self.write_queue = queue.Queue()
+        self.writer = None
+        self.lock = threading.RLock()
+        os.makedirs(directory, exist_ok=True)
+
+        found = []
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(FILE_SUFFIX):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime_ns, entry.name[:-len(FILE_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self.entries[key] = size
+            self.total_bytes += size
+        self.evict()
+
+    def get_path(self, key): return os.path.join(self.directory, key + FILE_SUFFIX)
+
+    def contains(self, key): return key in self.entries or key in self.pending
+
+    def get(self, key):
+        with self.lock: pending = self.pending.get(key)
+        if pending is not None: return pending[0]
+        if key not in self.entries: return None
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as f:
+                mode, width, height, *compression = f.readline().decode().split()
+                data = f.read()
+            if compression == ["zlib"]: data = zlib.decompress(data)
+            elif compression: raise ValueError(f"unknown compression {compression[0]}")
+            image = Image.frombytes(mode, (int(width), int(height)), data)
+            os.utime(path)
+        except (OSError, ValueError, zlib.error) as e:
+            print(f"[WARN] Dropping unreadable cache entry {key}: {e}")
+            self.discard(key)
+            return None
+        with self.lock:
+            if key in self.entries: self.entries.move_to_end(key)
+        return image
+
+    def put(self, key, image):
+        if image.mode not in CACHE_MODES: return
+        raw_bytes = image.width * image.height * len(image.getbands()) * (4 if image.mode in ('I', 'F') else 1)
+        if raw_bytes > self.max_entry_bytes: return
+        with self.lock:
+            if key in self.pending or self.pending_bytes + raw_bytes > self.max_pending_bytes: return
+            self.pending[key] = (image, raw_bytes)
+            self.pending_bytes += raw_bytes
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write_pending, name="DiskCacheWriter", daemon=True)
+                self.writer.start()
+        self.write_queue.put(key)
+
+    def write_pending(self):
+        while True:
+            key = self.write_queue.get()
+            try: self.write(key, self.pending[key][0])
+            except Exception as e: print(f"[WARN] Could not write cache entry {key}: {e}")
+            finally:
+                with self.lock: self.pending_bytes -= self.pending.pop(key)[1]
+                self.write_queue.task_done()
+
+    def flush(self): self.write_queue.join()
+
+    def write(self, key, image):
+        header = f"{image.mode} {image.width} {image.height} zlib\n".encode()
+        data = zlib.compress(image.tobytes(), COMPRESSION_LEVEL)
+        size = len(header) + len(data)
+
+        path = self.get_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not write cache entry {key}: {e}")
+            return
+        with self.lock:
+            if key in self.entries: self.total_bytes -= self.entries[key]
+            self.entries[key] = size
+            self.entries.move_to_end(key)
+            self.total_bytes += size
+            self.evict()
+
+    def discard(self, key):
+        with self.lock:
+            size = self.entries.pop(key, None)
+            if size is None: return
+            self.total_bytes -= size
+        try: os.remove(self.get_path(key))
+        except FileNotFoundError: pass
+
+    def evict(self):
+        with self.lock:
+            while self.total_bytes > self.max_bytes and self.entries: self.discard(next(iter(self.entries)))
+
+    def clear(self):
+        self.flush()
+        for key in list(self.entries): self.discard(key)
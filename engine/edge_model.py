@@ -0,0 +1,54 @@
+from engine import array_backend
+from engine.node_model import NodeModel
+from PIL import ImageFilter, ImageOps
+
+class EdgeModel(NodeModel):
+    METHODS = ["Sobel", "Canny"]
+    params = ('method', 'overlay', 'canny_threshold1', 'canny_threshold2')
+    kernel_version = 2
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Edge Detection", x, y)
+        self.method = EdgeModel.METHODS[0]
+        self.overlay = False
+        
+        self.canny_threshold1 = 50
+        self.canny_threshold2 = 150
+        
+        self.height = 215 
+
+    def process(self):
+        super().process() 
+        self.output_data = None
+        if array_backend.is_image(self.input_data):
+            try: self.output_data = self.run_kernel(self.input_data)
+            except Exception as e: self.output_data = None
+        else: self.output_data = None
+
+    def get_halo(self):
+        if self.method == "Sobel": return 1
+        return None
+
+    def find_canny_edges(self, gray):
+        if not array_backend.AVAILABLE: raise ValueError("NumPy is required for Canny edge detection.")
+        return array_backend.canny(gray, self.canny_threshold1, self.canny_threshold2)
+
+    def apply(self, image, stats=None):
+        edges_img = None
+        img_gray = image if image.mode == 'L' else ImageOps.grayscale(image)
+        if self.method == "Sobel":edges_img = img_gray.filter(ImageFilter.FIND_EDGES)
+        else: edges_img = array_backend.to_pil(self.find_canny_edges(array_backend.to_array(img_gray)))
+
+        if self.overlay and edges_img:
+            if image.mode != 'RGB': original_rgb = image.convert('RGB')
+            else:original_rgb = image.copy()
+            mask = edges_img.point(lambda p: 255 if p > 0 else 0, mode='1')
+            original_rgb.paste((255, 0, 0), mask=mask)
+            return original_rgb
+        return edges_img
+
+    def apply_array(self, array, stats=None):
+        gray = array_backend.to_gray(array)
+        edges = array_backend.find_edges(gray) if self.method == "Sobel" else self.find_canny_edges(gray)
+        if self.overlay: return array_backend.overlay_edges(array, edges)
+        return edges
@@ -0,0 +1,246 @@
+import heapq
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from engine import array_backend
+from engine import point_ops
+from engine import tiling
+from engine.profiler import NodeProfiler
+from engine.scheduler import ExecutionScheduler
+from engine.input_model import InputModel
+from engine.raster_input_model import RasterInputModel
+from engine.brightness_model import BrightnessModel
+from engine.output_model import OutputModel
+from engine.contrast_model import ContrastModel
+from engine.blur_model import BlurModel
+from engine.splitter_model import SplitterModel
+from engine.threshold_model import ThresholdModel
+from engine.edge_model import EdgeModel
+
+class RenderCancelled(Exception): pass
+
+
+class GraphEngine:
+    def __init__(self):
+        self.nodes = []
+        self.scheduler = ExecutionScheduler()
+        self.needs_update = False
+        self.process_lock = threading.Lock()
+        self.render_scale = 1.0
+        self.tile_size = tiling.DEFAULT_TILE_SIZE
+        self.tiled_pixel_threshold = 64 * 1024 * 1024
+        self.fuse_point_ops = True
+        self.backend = "pil"
+        self.disk_cache = None
+        self.cache_final_only = False
+        self.profiler = None
+        self.max_workers = os.cpu_count() or 1
+        self.executor = None
+
+        self.node_classes = {"Input": InputModel, "Raster Input": RasterInputModel, "Brightness": BrightnessModel, "Output": OutputModel, "Contrast": ContrastModel, "Blur": BlurModel, "Splitter": SplitterModel, "Threshold": ThresholdModel, "Edge Detect": EdgeModel, }
+
+    def add_node(self, node_type, x=0, y=0, params=None):
+        node_class = self.node_classes.get(node_type)
+        if not node_class:
+            print(f"[ERROR] Unknown node type: {node_type}")
+            return None
+        node = node_class(self, x, y)
+        if params:
+            for name, value in params.items(): node.set_param(name, value)
+        self.nodes.append(node)
+        self.scheduler.add_node(node)
+        self.request_update()
+        return node
+
+    def remove_node(self, node):
+        node.disconnect_all()
+        if node in self.nodes: self.nodes.remove(node)
+        self.scheduler.remove_node(node)
+        if self.profiler: self.profiler.forget(node)
+        self.request_update()
+
+    def clear(self):
+        for node in list(self.nodes): self.remove_node(node)
+
+    def connect(self, start_node, end_node):
+        if end_node.input_node is start_node: return
+        if end_node.input_node: self.disconnect(end_node.input_node, end_node)
+        start_node.connect_output(end_node)
+        if end_node.input_node is start_node: self.scheduler.add_edge(start_node, end_node)
+
+    def disconnect(self, start_node, end_node):
+        self.scheduler.remove_edge(start_node, end_node)
+        if end_node.input_node is start_node: end_node.disconnect_input()
+
+    def request_update(self, interactive=False): self.needs_update = True
+
+    def process_graph(self):
+        self.needs_update = False
+        return self.evaluate(self.get_execution_order())
+
+    def should_render_tiled(self, output_node):
+        try: source_size = tiling.get_chain(output_node)[0].get_source_size()
+        except tiling.TilingNotSupported: return False
+        return source_size is not None and source_size[0] * source_size[1] >= self.tiled_pixel_threshold
+
+    def render_tiled(self, output_node, on_tile=None):
+        with self.process_lock:
+            self.render_scale = 1.0
+            return tiling.render_tiled(output_node, self.tile_size, on_tile)
+
+    def set_backend(self, backend):
+        if backend == "numpy" and not array_backend.AVAILABLE:
+            print("[WARN] NumPy is not installed; keeping the PIL backend.")
+            return
+        if backend == "numpy": array_backend.load_numpy()
+        if backend == self.backend: return
+        self.backend = backend
+        for node in self.nodes:
+            if isinstance(node, InputModel): node.mark_dirty()
+        self.request_update()
+
+    def set_profiler(self, profiler):
+        self.profiler = profiler
+        for node in self.nodes: node.mark_dirty()
+        self.request_update()
+
+    def profile_graph(self):
+        if not self.profiler: self.set_profiler(NodeProfiler())
+        for node in self.nodes: node.mark_dirty()
+        disk_cache, self.disk_cache = self.disk_cache, None
+        try: self.process_graph()
+        finally: self.disk_cache = disk_cache
+        return self.profiler
+
+    def set_disk_cache(self, cache):
+        self.disk_cache = cache
+        self.request_update()
+
+    def read_disk_output(self, node, scale):
+        if not self.disk_cache or scale != 1.0 or not node.cacheable: return None
+        key = node.get_cache_key()
+        if key is None or not self.disk_cache.contains(key): return None
+        return self.disk_cache.get(key)
+
+    def get_nodes_to_process(self, execution_order, scale, disk_outputs=None):
+        required = set()
+        needs_input = set()
+        for node in reversed(execution_order):
+            if not node.dirty and scale in node.output_cache: continue
+            if node.output_nodes and not any(target in needs_input for target in node.output_nodes): continue
+            required.add(node)
+            data = self.read_disk_output(node, scale)
+            if data is None: needs_input.add(node)
+            elif disk_outputs is not None: disk_outputs[node] = data
+        return required
+
+    def _load_from_disk(self, node, scale, data):
+        if self.backend == "numpy": data = array_backend.to_array(data)
+        node.output_data = data
+        node.output_version += 1
+        node.dirty = False
+        node.cache_output(scale)
+
+    def _store_on_disk(self, node):
+        if self.cache_final_only and any(target.cacheable for target in node.output_nodes): return
+        key = node.get_cache_key()
+        if key is not None and array_backend.is_image(node.output_data): self.disk_cache.put(key, array_backend.to_pil(node.output_data))
+
+    def _process_node(self, node, scale):
+        node.dirty = False
+        try:
+            if self.profiler: self.profiler.measure([node], node.process)
+            else: node.process()
+            node.output_version += 1
+            if not node.dirty:
+                node.cache_output(scale)
+                if self.disk_cache and scale == 1.0 and node.cacheable: self._store_on_disk(node)
+        except Exception as e:
+            node.dirty = True
+            node.output_version += 1
+            print(f"[ERROR] Failed to process node {node.node_type}: {e}")
+
+    def _process_fused(self, run, scale):
+        for node in run: node.dirty = False
+        try:
+            if self.profiler: self.profiler.measure(run, lambda: point_ops.process_fused(run), "fused")
+            else: point_ops.process_fused(run)
+        except Exception as e:
+            print(f"[ERROR] Fused point operations failed, processing nodes individually: {e}")
+            return False
+        for node in run: node.output_version += 1
+        if not run[-1].dirty:
+            run[-1].cache_output(scale)
+            if self.disk_cache and scale == 1.0: self._store_on_disk(run[-1])
+        return True
+
+    def _run_unit(self, run, scale, disk_data=None):
+        if disk_data is not None:
+            if self.profiler: self.profiler.measure(run, lambda: self._load_from_disk(run[0], scale, disk_data), "disk cache")
+            else: self._load_from_disk(run[0], scale, disk_data)
+            return
+        if len(run) > 1 and self._process_fused(run, scale): return
+        for run_node in run: self._process_node(run_node, scale)
+
+    def _submit_unit(self, run, scale, disk_data=None):
+        if self.max_workers <= 1:
+            future = Future()
+            try: future.set_result(self._run_unit(run, scale, disk_data))
+            except Exception as e: future.set_exception(e)
+            return future
+        if self.executor is None: self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="NodeWorker")
+        return self.executor.submit(self._run_unit, run, scale, disk_data)
+
+    def evaluate(self, execution_order, is_cancelled=None, scale=1.0):
+        if execution_order is None:
+            print("[ERROR] Cyclic dependency detected in the graph. Cannot process.")
+            return None
+
+        with self.process_lock:
+            self.render_scale = scale
+            if self.profiler: self.profiler.begin_evaluation(scale)
+            on_disk = {}
+            required = self.get_nodes_to_process(execution_order, scale, on_disk)
+            computed = required - on_disk.keys()
+            order_index = {node: index for index, node in enumerate(execution_order)}
+            ready = []
+            for node in execution_order:
+                if node not in required:
+                    if scale in node.output_cache and node.output_data is not node.output_cache[scale]:
+                        node.output_data = node.output_cache[scale]
+                        node.output_version += 1
+                elif node in on_disk or node.input_node not in required: heapq.heappush(ready, (order_index[node], node))
+
+            running = {}
+            while ready or running:
+                if is_cancelled and is_cancelled():
+                    wait(running)
+                    raise RenderCancelled()
+                while ready:
+                    node = heapq.heappop(ready)[1]
+                    if node in on_disk: run = [node]
+                    else: run = point_ops.find_fusable_run(node, computed) if self.fuse_point_ops else [node]
+                    running[self._submit_unit(run, scale, on_disk.get(node))] = run
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run = running.pop(future)
+                    future.result()
+                    for target in run[-1].output_nodes:
+                        if target in computed and target.input_node is run[-1]: heapq.heappush(ready, (order_index[target], target))
+            if self.profiler: self.profiler.end_evaluation()
+
+        final_output_image = None
+        output_nodes_in_order = [node for node in execution_order if isinstance(node, OutputModel)]
+        if output_nodes_in_order: final_output_image = output_nodes_in_order[0].output_data
+        else:
+            all_output_nodes = [node for node in self.nodes if isinstance(node, OutputModel)]
+            if all_output_nodes: final_output_image = all_output_nodes[0].output_data
+        return final_output_image
+
+
+    def get_execution_order(self):
+        execution_order = self.scheduler.get_execution_order()
+        if execution_order is None:
+            print("[ERROR] Cycle detected! Nodes in cycle:", [f"{n.node_type} ({n.x:.0f}, {n.y:.0f})" for n in self.scheduler.cycle_nodes])
+            return None
+        return list(execution_order)
@@ -0,0 +1,52 @@
+import json
+import os
+from engine.graph_engine import GraphEngine
+from engine.input_model import InputModel
+
+FORMAT_VERSION = 1
+
+
+def get_stored_path(image_path, base_dir):
+    image_path = os.path.abspath(image_path)
+    if not base_dir: return image_path
+    try: return os.path.relpath(image_path, base_dir)
+    except ValueError: return image_path
+
+
+def graph_to_dict(engine, base_dir=""):
+    node_ids = {node: index for index, node in enumerate(engine.nodes)}
+    type_names = {node_class: name for name, node_class in engine.node_classes.items()}
+    nodes = []
+    for node in engine.nodes:
+        entry = {"type": type_names[type(node)], "x": round(node.x, 1), "y": round(node.y, 1)}
+        if node.params: entry["params"] = node.get_param_values()
+        if isinstance(node, InputModel) and node.image_path: entry["image"] = get_stored_path(node.image_path, base_dir)
+        nodes.append(entry)
+    links = [[node_ids[node.input_node], node_ids[node]] for node in engine.nodes if node.input_node in node_ids]
+    return {"version": FORMAT_VERSION, "nodes": nodes, "links": links}
+
+
+def save_graph(engine, file_path):
+    data = graph_to_dict(engine, os.path.dirname(os.path.abspath(file_path)))
+    with open(file_path, "w") as f: json.dump(data, f, separators=(",", ":"))
+
+
+def graph_from_dict(engine, data, base_dir=""):
+    if data.get("version") != FORMAT_VERSION: raise ValueError(f"Unsupported graph format version: {data.get('version')}")
+    nodes = []
+    for entry in data["nodes"]:
+        node = engine.add_node(entry["type"], entry["x"], entry["y"], entry.get("params"))
+        nodes.append(node)
+        image_path = entry.get("image")
+        if image_path and isinstance(node, InputModel):
+            if not node.load_image(os.path.join(base_dir, image_path)): print(f"[WARN] Could not open input image: {image_path}")
+    for start_index, end_index in data["links"]:
+        if nodes[start_index] and nodes[end_index]: engine.connect(nodes[start_index], nodes[end_index])
+    return nodes
+
+
+def load_graph(file_path, engine=None):
+    if engine is None: engine = GraphEngine()
+    with open(file_path) as f: data = json.load(f)
+    graph_from_dict(engine, data, os.path.dirname(os.path.abspath(file_path)))
+    return engine
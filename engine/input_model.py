@@ -0,0 +1,95 @@
+import threading
+from engine import array_backend
+from engine import disk_cache
+from engine.node_model import NodeModel
+from PIL import Image
+
+class InputModel(NodeModel):
+    cacheable = False
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Input", x, y)
+        self.image_path = None
+        self.pil_image = None 
+        self.proxy_image = None
+        self.source_array = None
+        self.decoded_image = None
+        self.decode_lock = threading.Lock()
+
+    def load_image(self, file_path):
+        try:
+            self.image_path = file_path
+            self.pil_image = Image.open(file_path)
+            self.proxy_image = None
+            self.output_data = self.pil_image 
+        except Exception as e:
+            self.image_path = None
+            self.pil_image = None
+            self.proxy_image = None
+            self.output_data = None
+        self.mark_dirty()
+        self.node_graph.needs_update = True 
+        return self.pil_image is not None
+
+    def is_decoded(self): return self.pil_image is None or self.decoded_image is self.pil_image
+
+    def get_full_image(self):
+        with self.decode_lock:
+            image = self.pil_image
+            if image is not None and self.decoded_image is not image:
+                image.load()
+                self.decoded_image = image
+            return image
+
+    def decode_async(self):
+        def decode():
+            try: self.get_full_image()
+            except Exception as e: print(f"[WARN] Background decode of {self.image_path} failed: {e}")
+        threading.Thread(target=decode, name="InputDecode", daemon=True).start()
+
+    def get_reduced_image(self, size):
+        if not self.is_decoded():
+            image = Image.open(self.image_path)
+            if image.draft(image.mode, size) is not None: return image
+        image = self.get_full_image()
+        factor = max(1, min(image.width // size[0], image.height // size[1]))
+        return image.reduce(factor) if factor > 1 else image
+
+    def process(self):
+        if not self.pil_image: self.output_data = None
+        elif self.node_graph.render_scale < 1.0: self.output_data = self.get_proxy_image(self.node_graph.render_scale)
+        else: self.output_data = self.get_full_image()
+        if self.output_data is not None and self.node_graph.backend == "numpy": self.output_data = self.get_source_array(self.output_data)
+
+    def get_thumbnail(self, size):
+        try:
+            image = self.get_reduced_image(size)
+            scale = min(1.0, size[0] / image.width, size[1] / image.height)
+            return image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.Resampling.LANCZOS)
+        except Exception as e:
+            print(f"[WARN] Could not create thumbnail for {self.image_path}: {e}")
+            return None
+
+    def get_source_array(self, image):
+        if self.source_array is None or self.source_array[0] is not image: self.source_array = (image, array_backend.to_array(image))
+        return self.source_array[1]
+
+    def get_cache_key(self):
+        if self.cache_key is None and self.pil_image:
+            try: self.cache_key = disk_cache.make_key(disk_cache.hash_file(self.image_path))
+            except OSError as e: print(f"[WARN] Could not hash input image {self.image_path}: {e}")
+        return self.cache_key
+
+    def get_source_size(self):
+        if not self.pil_image: return None
+        return self.pil_image.size
+
+    def read_region(self, box): return self.get_full_image().crop(box)
+
+    def get_proxy_image(self, scale):
+        width, height = self.get_source_size()
+        proxy_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if self.proxy_image is None or self.proxy_image.size != proxy_size:
+            source = self.get_reduced_image(proxy_size)
+            self.proxy_image = source if source.size == proxy_size else source.resize(proxy_size, Image.Resampling.BILINEAR)
+        return self.proxy_image
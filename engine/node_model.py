@@ -0,0 +1,121 @@
+from engine import array_backend
+from engine import point_ops
+from engine import disk_cache
+
+
+class NodeModel:
+    params = ()
+    cacheable = True
+    kernel_version = 1
+
+    def __init__(self, node_graph, node_type, x=0, y=0):
+        self.node_graph = node_graph
+        self.node_type = node_type
+        self.x = x
+        self.y = y
+        self.width = 150
+        self.height = 120
+        self.input_data = None
+        self.output_data = None
+        self.output_version = 0
+        self.input_node = None
+        self.output_nodes = []
+        self.dirty = True
+        self.output_cache = {}
+        self.cache_key = None
+
+    def get_param_values(self): return {name: getattr(self, name) for name in self.params}
+
+    def set_param(self, name, value):
+        if name not in self.params:
+            print(f"[WARN] Parameter '{name}' not found on node {self.node_type}")
+            return
+        if getattr(self, name) == value: return
+        setattr(self, name, value)
+        self.mark_dirty()
+        self.node_graph.request_update()
+
+    def connect_input(self, source_node):
+        self.disconnect_input()
+        self.input_node = source_node
+        if self not in source_node.output_nodes: source_node.output_nodes.append(self)
+        self.mark_dirty()
+        self.node_graph.needs_update = True
+
+    def connect_output(self, target_node): target_node.connect_input(self)
+
+    def disconnect_input(self):
+        if self.input_node:
+            source_node = self.input_node
+            self.input_node = None
+            self.input_data = None
+            if self in source_node.output_nodes: source_node.output_nodes.remove(self)
+            self.mark_dirty()
+            self.node_graph.needs_update = True
+
+    def disconnect_output(self, target_node):
+         if target_node in self.output_nodes:
+             if target_node.input_node == self: target_node.disconnect_input()
+
+    def disconnect_all(self):
+        self.disconnect_input()
+        outputs_to_disconnect = list(self.output_nodes)
+        for node in outputs_to_disconnect:
+            if node.input_node == self: node.disconnect_input()
+        self.output_nodes = []
+
+
+    def mark_dirty(self):
+        pending = [self]
+        seen = set()
+        while pending:
+            node = pending.pop()
+            if node in seen: continue
+            seen.add(node)
+            node.dirty = True
+            node.output_cache = {}
+            node.cache_key = None
+            pending.extend(node.output_nodes)
+
+    def get_cache_key(self):
+        if self.cache_key is None:
+            upstream_key = self.input_node.get_cache_key() if self.input_node else ""
+            if upstream_key is None: return None
+            self.cache_key = disk_cache.make_key(upstream_key, self.node_type, self.kernel_version, sorted(self.get_param_values().items()), self.node_graph.backend)
+        return self.cache_key
+
+    def cache_output(self, scale):
+        if scale != 1.0: self.output_cache = {cached_scale: data for cached_scale, data in self.output_cache.items() if cached_scale == 1.0}
+        self.output_cache[scale] = self.output_data
+
+    def process(self):
+        if self.input_node: self.input_data = self.input_node.output_data
+        else: self.input_data = None
+        self.output_data = self.input_data
+
+    def get_source_size(self): return None
+
+    def get_halo(self): return 0
+
+    def get_tile_grid(self, size): return 1
+
+    def get_point_mode(self, mode): return None
+
+    def needs_stats(self): return False
+
+    def collect_stats(self, image, stats):
+        histogram = point_ops.get_luma_histogram(image)
+        if stats is None: return histogram
+        return [total + count for total, count in zip(stats, histogram)]
+
+    def get_lut(self, mode, stats=None): return point_ops.lut_from_kernel(self.apply, mode, stats)
+
+    def apply(self, image, stats=None): return image
+
+    def apply_tile(self, image, stats, size): return self.apply(image, stats)
+
+    def apply_array(self, array, stats=None): return array_backend.to_array(self.apply(array_backend.to_pil(array), stats))
+
+    def run_kernel(self, data, stats=None):
+        if array_backend.is_array(data): return self.apply_array(data, stats)
+        return self.apply(data, stats)
@@ -0,0 +1,62 @@
+from engine import array_backend, tiling
+from engine.node_model import NodeModel
+from PIL import Image
+from engine.tiling import TilingNotSupported
+
+class OutputModel(NodeModel):
+    cacheable = False
+
+    def __init__(self, node_graph, x=0, y=0):
+         super().__init__(node_graph, "Output", x, y)
+         self.height = 100  
+
+    def process(self):
+        super().process()
+        image_to_output = None
+        if array_backend.is_image(self.input_data): image_to_output = array_backend.to_pil(self.input_data)
+        self.output_data = image_to_output
+        if self.output_data is None: print("[PROC] OutputNode: No valid input image received.")
+
+    def apply(self, image, stats=None):
+        if isinstance(image, Image.Image): return image
+        return None
+
+    def connect_output(self, target_node): pass
+
+    def render_output(self):
+        image = None
+        if self.node_graph.should_render_tiled(self):
+            try: image = self.node_graph.render_tiled(self)
+            except TilingNotSupported as e: print(f"[INFO] Tiled render unavailable, evaluating full graph: {e}")
+        if image is None:
+            self.node_graph.process_graph()
+            image = self.output_data 
+        return image
+
+    def stream_output(self, file_path):
+        if not file_path.lower().endswith('.npy') or not self.node_graph.should_render_tiled(self): return False
+        width, height = tiling.get_chain(self)[0].get_source_size()
+        target = []
+        def write_tile(box, tile):
+            data = array_backend.to_array(tile)
+            if not target: target.append(array_backend.np.lib.format.open_memmap(file_path, mode='w+', dtype=data.dtype, shape=(height, width) + data.shape[2:]))
+            target[0][box[1]:box[3], box[0]:box[2]] = data
+        try: self.node_graph.render_tiled(self, write_tile)
+        except TilingNotSupported as e:
+            print(f"[INFO] Tiled render unavailable, evaluating full graph: {e}")
+            return False
+        if target: target[0].flush()
+        return bool(target)
+
+    def save_output(self, file_path, image):
+        if file_path.lower().endswith('.npy'):
+            array_backend.np.save(file_path, array_backend.to_array(image))
+            return
+        save_img = image
+        if file_path.lower().endswith(('.jpg', '.jpeg')):
+             if save_img.mode == 'RGBA':
+                  bg = Image.new("RGB", save_img.size, (255, 255, 255))
+                  bg.paste(save_img, mask=save_img.split()[3])
+                  save_img = bg
+             elif save_img.mode == 'P' and 'transparency' in save_img.info: save_img = save_img.convert('RGB')
+        save_img.save(file_path)
@@ -0,0 +1,105 @@
+from PIL import Image
+from engine import array_backend
+
+POINT_MODES = ('L', 'RGB', 'RGBA')
+
+_ramp_images = {}
+
+
+def get_ramp_image(mode):
+    if mode not in _ramp_images:
+        ramp = Image.frombytes('L', (256, 1), bytes(range(256)))
+        _ramp_images[mode] = ramp if mode == 'L' else Image.merge(mode, [ramp] * len(mode))
+    return _ramp_images[mode]
+
+
+def lut_from_kernel(kernel, mode, stats=None):
+    result = kernel(get_ramp_image(mode), stats)
+    return [list(band.getdata()) for band in result.split()]
+
+def get_node_lut(node, mode, stats=None): return node.get_lut(mode, stats)
+
+
+def compose_luts(first, second):
+    if first is None: return second
+    return [[second_band[value] for value in first_band] for first_band, second_band in zip(first, second)]
+
+
+def apply_lut(image, lut):
+    if lut is None: return image
+    if array_backend.is_array(image): return array_backend.apply_lut(image, lut)
+    return image.point([value for band in lut for value in band])
+
+
+def get_luma_histogram(image, lut=None):
+    if array_backend.get_mode(image) != 'L':
+        image = apply_lut(image, lut)
+        if array_backend.is_array(image): return array_backend.luma_histogram(image)
+        return image.convert('L').histogram()
+
+    histogram = array_backend.luma_histogram(image) if array_backend.is_array(image) else image.histogram()
+    if lut is None: return histogram
+    remapped = [0] * 256
+    for value, count in enumerate(histogram): remapped[lut[0][value]] += count
+    return remapped
+
+
+def otsu_threshold(histogram):
+    total = sum(histogram)
+    total_sum = sum(value * count for value, count in enumerate(histogram))
+    best_value, best_variance = 0, -1.0
+    weight = weighted_sum = 0
+    for value, count in enumerate(histogram):
+        weight += count
+        weighted_sum += value * count
+        if weight == 0: continue
+        if weight == total: break
+        difference = weighted_sum / weight - (total_sum - weighted_sum) / (total - weight)
+        variance = weight * (total - weight) * difference * difference
+        if variance > best_variance: best_value, best_variance = value, variance
+    return best_value
+
+
+def find_fusable_run(node, required):
+    if not node.input_node or not array_backend.is_image(node.input_node.output_data): return [node]
+
+    run = []
+    mode = array_backend.get_mode(node.input_node.output_data)
+    current = node
+    while current in required:
+        output_mode = current.get_point_mode(mode)
+        if output_mode is None: break
+        run.append(current)
+        mode = output_mode
+        if len(current.output_nodes) != 1: break
+        current = current.output_nodes[0]
+    return run or [node]
+
+
+def apply_fused(run, image):
+    lut = None
+    mode = array_backend.get_mode(image)
+    for node in run:
+        output_mode = node.get_point_mode(mode)
+        if output_mode != mode:
+            image = array_backend.convert(apply_lut(image, lut), output_mode)
+            lut = None
+            mode = output_mode
+
+        stats = None
+        if node.needs_stats():
+            if lut is not None and mode != 'L':
+                image = apply_lut(image, lut)
+                lut = None
+            stats = get_luma_histogram(image, lut)
+        lut = compose_luts(lut, get_node_lut(node, mode, stats))
+    return apply_lut(image, lut)
+
+
+def process_fused(run):
+    head, tail = run[0], run[-1]
+    head.input_data = head.input_node.output_data
+    result = apply_fused(run, head.input_data)
+    for node in run[1:]: node.input_data = None
+    for node in run[:-1]: node.output_data = None
+    tail.output_data = result
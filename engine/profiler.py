@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+import time
+from engine import array_backend
+
+
+def get_nbytes(data):
+    if array_backend.is_array(data): return data.nbytes
+    if not array_backend.is_image(data): return 0
+    return data.width * data.height * len(data.getbands())
+
+
+class NodeProfiler:
+    def __init__(self):
+        self.records = {}
+        self.events = []
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.scale = 1.0
+        self.evaluation_start = self.origin
+
+    def begin_evaluation(self, scale):
+        with self.lock:
+            self.events = []
+            self.scale = scale
+            self.evaluation_start = time.perf_counter()
+
+    def end_evaluation(self):
+        wall = time.perf_counter() - self.evaluation_start
+        with self.lock: self.events.append(("Evaluate", self.evaluation_start, wall, threading.get_ident(), {"category": "graph", "scale": self.scale, "wall_ms": wall * 1000, "nodes": len(self.events)}))
+
+    def measure(self, nodes, function, category="process"):
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try: return function()
+        finally:
+            wall = time.perf_counter() - start
+            output = nodes[-1].output_data
+            record = {"wall_ms": wall * 1000, "cpu_ms": (time.thread_time() - cpu_start) * 1000, "output_bytes": get_nbytes(output), "output_size": array_backend.get_size(output) if array_backend.is_image(output) else None, "category": category, "scale": self.scale, "fused": len(nodes) > 1}
+            name = " + ".join(node.node_type for node in nodes)
+            with self.lock:
+                for node in nodes: self.records[node] = record
+                self.events.append((name, start, wall, threading.get_ident(), record))
+
+    def get_record(self, node): return self.records.get(node)
+
+    def get_heat(self, node, nodes):
+        record = self.records.get(node)
+        if not record: return None
+        slowest = max((self.records[other]["wall_ms"] for other in nodes if other in self.records), default=0.0)
+        return record["wall_ms"] / slowest if slowest > 0 else 0.0
+
+    def forget(self, node): self.records.pop(node, None)
+
+    def to_trace(self):
+        pid = os.getpid()
+        with self.lock: events = list(self.events)
+        trace_events = []
+        for name, start, wall, thread_id, record in events:
+            trace_events.append({"name": name, "cat": record["category"], "ph": "X", "ts": (start - self.origin) * 1e6, "dur": wall * 1e6, "pid": pid, "tid": thread_id, "args": record})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save_trace(self, file_path):
+        with open(file_path, "w") as f: json.dump(self.to_trace(), f)
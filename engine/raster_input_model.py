@@ -0,0 +1,77 @@
+import os
+from engine import disk_cache
+from engine import raster_source
+from engine.input_model import InputModel
+
+class RasterInputModel(InputModel):
+    params = ('raw_width', 'raw_height', 'raw_dtype', 'raw_channels', 'raw_offset', 'value_min', 'value_max')
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, x, y)
+        self.node_type = "Raster Input"
+        self.raw_width = 0
+        self.raw_height = 0
+        self.raw_dtype = 'u1'
+        self.raw_channels = 1
+        self.raw_offset = 0
+        self.value_min = None
+        self.value_max = None
+        self.raster = None
+        self.detected_range = (0, 255)
+        self.proxy_range = None
+
+    def load_image(self, file_path):
+        try:
+            self.raster = raster_source.open_raster(file_path, self.raw_width, self.raw_height, self.raw_dtype, self.raw_channels, self.raw_offset)
+            self.detected_range = raster_source.find_value_range(self.raster)
+            self.image_path = file_path
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[ERROR] Could not map raster {file_path}: {e}")
+            self.raster = None
+            self.image_path = None
+        self.proxy_image = None
+        self.output_data = None
+        self.mark_dirty()
+        self.node_graph.needs_update = True
+        return self.raster is not None
+
+    def process(self):
+        if self.raster is None: self.output_data = None
+        elif self.node_graph.render_scale < 1.0: self.output_data = self.get_proxy_image(self.node_graph.render_scale)
+        elif self.node_graph.backend == "numpy": self.output_data = raster_source.to_uint8(self.raster, self.get_value_range())
+        else: self.output_data = self.get_full_image()
+        if self.output_data is not None and self.node_graph.backend == "numpy": self.output_data = self.get_source_array(self.output_data)
+
+    def get_full_image(self):
+        if self.raster is None: return None
+        return raster_source.to_pil(self.raster, self.get_value_range())
+
+    def get_value_range(self):
+        low = self.detected_range[0] if self.value_min is None else self.value_min
+        high = self.detected_range[1] if self.value_max is None else self.value_max
+        return (low, high if high > low else low + 1)
+
+    def get_proxy_image(self, scale):
+        if self.proxy_range != self.get_value_range():
+            self.proxy_image = None
+            self.proxy_range = self.get_value_range()
+        return super().get_proxy_image(scale)
+
+    def decode_async(self): pass
+
+    def get_reduced_image(self, size): return raster_source.read_reduced(self.raster, size, self.get_value_range())
+
+    def get_cache_key(self):
+        if self.cache_key is None and self.raster is not None:
+            try:
+                stat = os.stat(self.image_path)
+                self.cache_key = disk_cache.make_key(self.image_path, stat.st_size, stat.st_mtime_ns, self.get_param_values(), self.get_value_range())
+            except OSError as e: print(f"[WARN] Could not stat raster {self.image_path}: {e}")
+        return self.cache_key
+
+    def get_source_size(self):
+        if self.raster is None: return None
+        return raster_source.get_size(self.raster)
+
+    def read_region(self, box): return raster_source.read_region(self.raster, box, self.get_value_range())
+
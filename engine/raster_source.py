@@ -0,0 +1,81 @@
+import os
+from engine import array_backend
+from engine.array_backend import np
+from PIL import Image
+
+RAW_EXTENSIONS = ('.raw', '.bin')
+RANGE_SAMPLE_PIXELS = 1024 * 1024
+TIFF_RAW_MODES = {'L': ('u1', 1), 'RGB': ('u1', 3), 'RGBA': ('u1', 4), 'I;16': ('<u2', 1), 'I;16B': ('>u2', 1)}
+
+
+def open_npy(file_path): return np.load(file_path, mmap_mode='r', allow_pickle=False)
+
+def open_raw(file_path, width, height, dtype, channels=1, offset=0):
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    return np.memmap(file_path, dtype=np.dtype(dtype), mode='r', offset=offset, shape=shape)
+
+def open_tiff(file_path):
+    with Image.open(file_path) as image:
+        if image.format != "TIFF": raise ValueError(f"{file_path} is not a TIFF file.")
+        width, height = image.size
+        tiles = sorted(image.tile, key=lambda tile: tile[2])
+        if any(tile[0] != "raw" for tile in tiles): raise ValueError("Only uncompressed TIFF strips can be memory-mapped.")
+        rawmode = tiles[0][3][0]
+        if rawmode not in TIFF_RAW_MODES: raise ValueError(f"Unsupported TIFF pixel layout: {rawmode}")
+        dtype, channels = TIFF_RAW_MODES[rawmode]
+        row_bytes = width * channels * np.dtype(dtype).itemsize
+        first_offset = tiles[0][2]
+        for codec, extents, offset, args in tiles:
+            contiguous = extents[0] == 0 and extents[2] == width and offset == first_offset + extents[1] * row_bytes
+            if not contiguous or args[1] not in (0, row_bytes) or args[2] != 1: raise ValueError("TIFF strips are not stored contiguously.")
+    return open_raw(file_path, width, height, dtype, channels, first_offset)
+
+def open_raster(file_path, width=0, height=0, dtype='u1', channels=1, offset=0):
+    if not array_backend.AVAILABLE: raise ValueError("NumPy is required for memory-mapped inputs.")
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.npy': array = open_npy(file_path)
+    elif extension in ('.tif', '.tiff'): array = open_tiff(file_path)
+    elif extension in RAW_EXTENSIONS:
+        if width <= 0 or height <= 0: raise ValueError("Raw files need an explicit width and height.")
+        array = open_raw(file_path, width, height, dtype, channels, offset)
+    else: raise ValueError(f"Unsupported raster file type: {extension}")
+
+    if array.ndim == 3 and array.shape[2] == 1: array = array[..., 0]
+    if array.ndim not in (2, 3) or (array.ndim == 3 and array.shape[2] not in (3, 4)): raise ValueError(f"Unsupported raster shape: {array.shape}")
+    if array.dtype.kind not in 'uf': raise ValueError(f"Unsupported raster dtype: {array.dtype}")
+    return array
+
+
+def find_value_range(array):
+    if array.dtype == np.uint8: return (0, 255)
+    step = max(1, int((array.shape[0] * array.shape[1] / RANGE_SAMPLE_PIXELS) ** 0.5))
+    sample = np.asarray(array[::step, ::step])
+    if array.dtype.kind == 'f': sample = sample[np.isfinite(sample)]
+    if not sample.size: return (0, 1)
+    low, high = sample.min().item(), sample.max().item()
+    return (low, high if high > low else low + 1)
+
+def scale_values(values, value_range):
+    low, high = value_range
+    scaled = (values.astype(np.float32) - np.float32(low)) * np.float32(255 / (high - low))
+    np.clip(scaled, 0, 255, out=scaled)
+    np.nan_to_num(scaled, copy=False)
+    return np.rint(scaled).astype(np.uint8)
+
+def to_uint8(array, value_range):
+    if array.dtype == np.uint8 and tuple(value_range) == (0, 255): return array
+    if array.dtype.kind == 'u' and array.dtype.itemsize <= 2: return np.take(scale_values(np.arange(1 << (8 * array.dtype.itemsize)), value_range), array)
+    return scale_values(array, value_range)
+
+def to_pil(array, value_range): return array_backend.to_pil(to_uint8(array, value_range))
+
+def get_size(array): return array.shape[1], array.shape[0]
+
+def read_region(array, box, value_range):
+    left, top, right, bottom = box
+    return to_pil(array[top:bottom, left:right], value_range)
+
+def read_reduced(array, size, value_range):
+    width, height = get_size(array)
+    step = max(1, min(width // size[0], height // size[1]))
+    return to_pil(array[::step, ::step], value_range)
@@ -0,0 +1,78 @@
+import heapq
+
+
+class ExecutionScheduler:
+    def __init__(self):
+        self.successors = {}
+        self.predecessors = {}
+        self.sequence = {}
+        self.next_sequence = 0
+        self.order = None
+        self.cycle_nodes = []
+
+    def add_node(self, node):
+        if node in self.successors: return
+        self.successors[node] = {}
+        self.predecessors[node] = {}
+        self.sequence[node] = self.next_sequence
+        self.next_sequence += 1
+        self.order = None
+
+    def remove_node(self, node):
+        if node not in self.successors: return
+        for successor in self.successors.pop(node): self.predecessors[successor].pop(node, None)
+        for predecessor in self.predecessors.pop(node): self.successors[predecessor].pop(node, None)
+        del self.sequence[node]
+        self.order = None
+
+    def add_edge(self, source, target):
+        self.add_node(source)
+        self.add_node(target)
+        if target in self.successors[source]: return
+        self.successors[source][target] = None
+        self.predecessors[target][source] = None
+        self.order = None
+
+    def remove_edge(self, source, target):
+        if source not in self.successors or target not in self.successors[source]: return
+        del self.successors[source][target]
+        del self.predecessors[target][source]
+        self.order = None
+
+    def invalidate(self): self.order = None
+
+    def get_priority(self, node): return (node.y, node.x, self.sequence[node])
+
+    def get_execution_order(self):
+        if self.order is not None: return self.order
+
+        in_degree = {node: len(predecessors) for node, predecessors in self.predecessors.items()}
+        ready = [(self.get_priority(node), node) for node, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+        result = []
+        while ready:
+            _, node = heapq.heappop(ready)
+            result.append(node)
+            for successor in self.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0: heapq.heappush(ready, (self.get_priority(successor), successor))
+
+        if len(result) != len(self.successors):
+            self.cycle_nodes = self.find_cycle_nodes(in_degree)
+            return None
+        self.cycle_nodes = []
+        self.order = result
+        return result
+
+    def find_cycle_nodes(self, in_degree):
+        remaining = {node for node, degree in in_degree.items() if degree > 0}
+        out_degree = {node: sum(1 for successor in self.successors[node] if successor in remaining) for node in remaining}
+        pending = [node for node, degree in out_degree.items() if degree == 0]
+        while pending:
+            node = pending.pop()
+            remaining.discard(node)
+            for predecessor in self.predecessors[node]:
+                if predecessor in remaining:
+                    out_degree[predecessor] -= 1
+                    if out_degree[predecessor] == 0: pending.append(predecessor)
+        return sorted(remaining, key=self.get_priority)
@@ -0,0 +1,42 @@
+from engine import array_backend
+from engine.node_model import NodeModel
+from PIL import Image
+
+class SplitterModel(NodeModel):
+    MODES = ["Red", "Green", "Blue", "Alpha", "Gray (R)", "Gray (G)", "Gray (B)", "Gray (A)"]
+    params = ('output_mode',)
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Color Splitter", x, y)
+        self.output_mode = SplitterModel.MODES[0] 
+        self.height = 130 
+
+    def process(self):
+        super().process() 
+        self.output_data = None 
+        if array_backend.is_image(self.input_data):
+            try: self.output_data = self.run_kernel(self.input_data)
+            except Exception as e: self.output_data = None
+        else: self.output_data = None
+
+    def apply(self, image, stats=None):
+        num_bands = len(image.getbands())
+        mode_parts = self.output_mode.split() 
+        target_channel = mode_parts[-1].replace('(', '').replace(')', '') 
+
+        channel_index = -1
+        if target_channel == 'R' and num_bands >= 1: channel_index = 0
+        elif target_channel == 'G' and num_bands >= 2: channel_index = 1
+        elif target_channel == 'B' and num_bands >= 3: channel_index = 2
+        elif target_channel == 'A' and num_bands == 4: channel_index = 3
+        elif target_channel == 'A' and num_bands < 4: return Image.new('L', image.size, 0)
+        elif channel_index == -1: return Image.new('L', image.size, 0) 
+        if num_bands == 1: return image
+        return image.getchannel(channel_index)
+
+    def apply_array(self, array, stats=None):
+        num_bands = 1 if array.ndim == 2 else array.shape[2]
+        target_channel = self.output_mode.split()[-1].replace('(', '').replace(')', '')
+        channel_index = {'R': 0, 'G': 1, 'B': 2, 'A': 3}.get(target_channel, -1)
+        if channel_index == -1 or channel_index >= num_bands or (target_channel == 'A' and num_bands < 4): return array_backend.blank(array_backend.get_size(array))
+        return array_backend.get_channel(array, channel_index)
@@ -0,0 +1,67 @@
+import math
+from engine import array_backend
+from engine.node_model import NodeModel
+from engine.point_ops import POINT_MODES, get_luma_histogram, otsu_threshold
+from PIL import ImageChops, ImageFilter, ImageOps
+
+class ThresholdModel(NodeModel):
+    METHODS = ["Binary", "Otsu", "Adaptive Mean", "Adaptive Gaussian"]
+    params = ('method', 'threshold_value', 'block_size', 'adaptive_offset')
+
+    def __init__(self, node_graph, x=0, y=0):
+        super().__init__(node_graph, "Threshold", x, y)
+        self.threshold_value = 128
+        self.block_size = 51
+        self.adaptive_offset = 10
+        self.method = ThresholdModel.METHODS[0]
+        self.height = 250
+
+    def needs_stats(self): return self.method == "Otsu"
+
+    def process(self):
+        super().process() 
+        self.output_data = None
+
+        if array_backend.is_image(self.input_data):
+            try: self.output_data = self.run_kernel(self.input_data)
+            except Exception as e:self.output_data = None
+        else: self.output_data = None
+
+    def get_point_mode(self, mode):
+        if self.method in ("Binary", "Otsu") and mode in POINT_MODES: return 'L'
+        return None
+
+    def get_halo(self):
+        if self.method == "Adaptive Mean": return self.get_block_size() // 2
+        if self.method == "Adaptive Gaussian": return max(self.get_block_size() // 2, math.ceil(3 * self.get_sigma()) + 3)
+        return 0
+
+    def get_block_size(self): return max(3, round(self.block_size * self.node_graph.render_scale) // 2 * 2 + 1)
+
+    def get_sigma(self): return 0.3 * ((self.get_block_size() - 1) * 0.5 - 1) + 0.8
+
+    def get_offset(self): return max(-127, min(127, int(self.adaptive_offset)))
+
+    def get_threshold(self, gray, stats):
+        if self.method != "Otsu": return self.threshold_value
+        return otsu_threshold(stats if stats is not None else get_luma_histogram(gray))
+
+    def get_local_mean(self, img_gray):
+        if self.method == "Adaptive Gaussian": return img_gray.filter(ImageFilter.GaussianBlur(self.get_sigma()))
+        if array_backend.AVAILABLE: return array_backend.to_pil(array_backend.box_mean(array_backend.to_array(img_gray), self.get_block_size()))
+        return img_gray.filter(ImageFilter.BoxBlur(self.get_block_size() // 2))
+
+    def apply(self, image, stats=None):
+        img_gray = image if image.mode == 'L' else ImageOps.grayscale(image)
+        if self.method.startswith("Adaptive"):
+            offset = self.get_offset()
+            difference = ImageChops.subtract(self.get_local_mean(img_gray), img_gray, offset=128)
+            return difference.point(lambda p: 255 if p < offset + 128 else 0)
+        value = self.get_threshold(img_gray, stats)
+        return img_gray.point(lambda p: 255 if p > value else 0)
+
+    def apply_array(self, array, stats=None):
+        gray = array_backend.to_gray(array)
+        if self.method == "Adaptive Mean": return array_backend.adaptive_threshold(gray, array_backend.box_mean(gray, self.get_block_size()), self.get_offset())
+        if self.method == "Adaptive Gaussian": return array_backend.adaptive_threshold(gray, array_backend.to_array(self.get_local_mean(array_backend.to_pil(gray))), self.get_offset())
+        return array_backend.threshold(gray, self.get_threshold(gray, stats))
@@ -0,0 +1,77 @@
+from PIL import Image
+
+DEFAULT_TILE_SIZE = 1024
+
+
+class TilingNotSupported(Exception): pass
+
+
+def get_chain(output_node):
+    chain = []
+    seen = set()
+    node = output_node
+    while node is not None:
+        if node in seen: raise TilingNotSupported("Cyclic dependency in node chain.")
+        seen.add(node)
+        chain.append(node)
+        node = node.input_node
+    chain.reverse()
+    return chain
+
+
+def _expand_box(box, margin, size, grid=1):
+    left, top, right, bottom = box
+    width, height = size
+    left, top = max(0, left - margin) // grid * grid, max(0, top - margin) // grid * grid
+    right, bottom = -(-(right + margin) // grid) * grid, -(-(bottom + margin) // grid) * grid
+    return (left, top, min(width, right), min(height, bottom))
+
+
+def render_tile(source, stages, halos, stats, box, size):
+    regions = []
+    region = box
+    for stage, halo in zip(reversed(stages), reversed(halos)):
+        regions.append(region)
+        region = _expand_box(region, halo, size, stage.get_tile_grid(size))
+    regions.reverse()
+    tile = source.read_region(region)
+
+    for stage, stage_stats, inner_region in zip(stages, stats, regions):
+        tile = stage.apply_tile(tile, stage_stats, size)
+        if tile is None: raise TilingNotSupported(f"Node {stage.node_type} produced no output for tile {box}.")
+        if inner_region != region:
+            tile = tile.crop((inner_region[0] - region[0], inner_region[1] - region[1], inner_region[2] - region[0], inner_region[3] - region[1]))
+            region = inner_region
+    return tile
+
+
+def iter_tiles(source, stages, halos, stats, size, tile_size=DEFAULT_TILE_SIZE):
+    width, height = size
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            box = (left, top, min(left + tile_size, width), min(top + tile_size, height))
+            yield box, render_tile(source, stages, halos, stats, box, size)
+
+
+def render_tiled(output_node, tile_size=DEFAULT_TILE_SIZE, on_tile=None):
+    chain = get_chain(output_node)
+    source, stages = chain[0], chain[1:]
+    size = source.get_source_size()
+    if size is None: raise TilingNotSupported(f"Node {source.node_type} is not a tileable image source.")
+
+    halos = [stage.get_halo() for stage in stages]
+    for stage, halo in zip(stages, halos):
+        if halo is None: raise TilingNotSupported(f"Node {stage.node_type} cannot be evaluated in tiles.")
+
+    stats = [None] * len(stages)
+    for index, stage in enumerate(stages):
+        if not stage.needs_stats(): continue
+        for box, tile in iter_tiles(source, stages[:index], halos[:index], stats[:index], size, tile_size): stats[index] = stage.collect_stats(tile, stats[index])
+
+    result = None
+    for box, tile in iter_tiles(source, stages, halos, stats, size, tile_size):
+        if on_tile: on_tile(box, tile)
+        else:
+            if result is None: result = Image.new(tile.mode, size)
+            result.paste(tile, box[:2])
+    return result
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from node_graph import NodeGraph
+from engine.disk_cache import DiskCache
 from ui import Toolbar, PropertiesPanel, PreviewWindow
 
 if __name__ == "__main__":
@@ -40,6 +41,9 @@ if __name__ == "__main__":
     
     preview_window = PreviewWindow(preview_frame)
     graph = NodeGraph(graph_frame, preview_window)
+    try: graph.set_disk_cache(DiskCache())
+    except OSError as e: print(f"[WARN] Disk cache disabled: {e}")
     
     toolbar.set_node_graph(graph)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    if graph.disk_cache: graph.disk_cache.flush()
\ No newline at end of file
@@ -1,5 +1,13 @@
+import queue
 import tkinter as tk
+from render_worker import RenderWorker
+from thumbnails import ThumbnailRenderer
+from spatial_index import SpatialIndex
+from engine import graph_file
+from engine.graph_engine import GraphEngine
+from engine.profiler import NodeProfiler
 from nodes.input_node import InputNode
+from nodes.raster_input_node import RasterInputNode
 from nodes.brightness_node import BrightnessNode
 from nodes.output_node import OutputNode
 from nodes.contrast_node import ContrastNode 
@@ -11,12 +19,22 @@ from nodes.edge_node import EdgeNode
 APP_FONT = ("Segoe UI", 9)
 APP_FONT_BOLD = ("Segoe UI", 10, "bold")
 
-class NodeGraph:
+class NodeGraph(GraphEngine):
     def __init__(self, master, preview_window):
+        super().__init__()
         self.master = master
         self.preview_window = preview_window
-        self.nodes = []
-        self.links = [] 
+        self.links_by_source = {}
+        self.links_by_target = {}
+        self.link_positions = {}
+        self.node_index = SpatialIndex()
+        self.realized_nodes = set()
+        self.zoom = 1.0
+        self.min_zoom = 0.2
+        self.max_zoom = 2.0
+        self.detail_zoom = 0.75
+        self.label_zoom = 0.4
+        self.viewport_margin = 200
 
         self.canvas_bg_color = '#4D4D4D' 
         self.canvas = tk.Canvas(master, width=800, height=600, bg=self.canvas_bg_color, highlightthickness=0)
@@ -32,9 +50,18 @@ class NodeGraph:
         self.last_drag_y = 0
         self.pan_sensitivity = 0.02 
         
-        self.needs_update = False 
         self.debounce_time = 0.05 
         self.update_scheduled_id = None 
+        self.render_worker = RenderWorker()
+        self.render_results = queue.Queue()
+        self.render_poll_interval = 16
+        self.render_poll_id = None
+        self.interacting = False
+        self.refine_delay = 0.4
+        self.refine_scheduled_id = None
+        self.show_thumbnails = True
+        self.thumbnails = ThumbnailRenderer()
+        self.thumbnail_poll_id = None
 
         self.canvas.bind("<ButtonPress-1>", self.on_canvas_press)
         self.canvas.bind("<ButtonPress-2>", self.on_canvas_pan_press) 
@@ -48,61 +75,103 @@ class NodeGraph:
         self.canvas.bind("<Button-4>", lambda e: self.on_zoom(e, 1)) 
         self.canvas.bind("<Button-5>", lambda e: self.on_zoom(e, -1)) 
         self.canvas.bind("<Double-Button-1>", self.on_double_click)
+        self.canvas.bind("<Configure>", lambda e: self.update_viewport())
         self.master.bind_all("<Delete>", self.delete_selected) 
         self.master.bind_all("<BackSpace>", self.delete_selected) 
         
-        self.node_classes = {"Input": InputNode, "Brightness": BrightnessNode, "Output": OutputNode, "Contrast": ContrastNode, "Blur": BlurNode, "Splitter": SplitterNode, "Threshold": ThresholdNode, "Edge Detect": EdgeNode, }
+        self.node_classes = {"Input": InputNode, "Raster Input": RasterInputNode, "Brightness": BrightnessNode, "Output": OutputNode, "Contrast": ContrastNode, "Blur": BlurNode, "Splitter": SplitterNode, "Threshold": ThresholdNode, "Edge Detect": EdgeNode, }
         
 
-    def add_node(self, node_type, x=None, y=None):
-        node_class = self.node_classes.get(node_type)
-        if node_class:
-            if x is None or y is None:
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
-                view_x = self.canvas.canvasx(0) 
-                view_y = self.canvas.canvasy(0) 
-                x = view_x + canvas_width / 2
-                y = view_y + canvas_height / 2
-
-            node = node_class(self, x, y)
-            self.nodes.append(node)
-            node.draw()
-            self.request_update() 
-            return node
-        else: return None
+    def add_node(self, node_type, x=None, y=None, params=None):
+        if x is None or y is None: x, y = self.to_model(self.canvas.winfo_width() / 2, self.canvas.winfo_height() / 2)
+        node = super().add_node(node_type, x, y, params)
+        if node:
+            self.node_index.insert(node, node.get_bounds())
+            self.update_viewport()
+        return node
 
     def select_node(self, node):
         if self.selected_node and self.selected_node != node: self.selected_node.deselect()
         self.selected_node = node
         if node:
             node.selected = True 
-            node.node_graph.canvas.itemconfig(node.id, outline="deep sky blue", width=2) 
+            if node.id: node.node_graph.canvas.itemconfig(node.id, outline="deep sky blue", width=2) 
+
+    def remove_node(self, node):
+        if node is self.selected_node: self.select_node(None)
+        node.delete()
+        self.realized_nodes.discard(node)
+        for link in self.get_node_links(node): self.remove_link(link)
+        self.links_by_source.pop(node, None)
+        self.links_by_target.pop(node, None)
+        self.link_positions.pop(node, None)
+        super().remove_node(node)
 
     def delete_selected(self, event=None):
         if self.selected_node:
-            node_to_delete = self.selected_node
-            self.select_node(None) 
-            node_to_delete.delete() 
-            if node_to_delete in self.nodes: self.nodes.remove(node_to_delete)
+            self.remove_node(self.selected_node)
             self.draw_links() 
-            self.request_update() 
         else: print("[INFO] No node selected to delete.")
 
+    def open_graph(self, file_path):
+        self.clear()
+        try: graph_file.load_graph(file_path, self)
+        except (OSError, ValueError, KeyError, IndexError) as e: print(f"[ERROR] Could not open graph {file_path}: {e}")
+        self.draw_links()
+
+    def set_profiling(self, enabled):
+        self.set_profiler(NodeProfiler() if enabled else None)
+        self.update_profile_badges()
+
+    def update_profile_badges(self):
+        for node in self.realized_nodes: node.update_profile()
+
+    def set_thumbnails(self, enabled):
+        self.show_thumbnails = enabled
+        for node in self.realized_nodes:
+            if node.lod == "full": node.draw_thumbnail()
+        self.update_thumbnails()
+
+    def update_thumbnails(self):
+        for node in self.realized_nodes:
+            if node.lod != "full" or not node.wants_thumbnail(): continue
+            version = node.get_thumbnail_version()
+            if version == node.thumbnail_version or self.thumbnails.is_pending(node, version): continue
+            job = node.get_thumbnail_job()
+            if job: self.thumbnails.submit(node, version, job)
+            else: node.set_thumbnail(None, version)
+        if self.thumbnails.pending and self.thumbnail_poll_id is None: self.thumbnail_poll_id = self.master.after(self.render_poll_interval, self._poll_thumbnails)
+
+    def _poll_thumbnails(self):
+        self.thumbnail_poll_id = None
+        while True:
+            try: node, version, image = self.thumbnails.results.get_nowait()
+            except queue.Empty: break
+            self.thumbnails.pending.discard((node, version))
+            if node.get_thumbnail_version() == version: node.set_thumbnail(image, version)
+        if self.thumbnails.pending: self.thumbnail_poll_id = self.master.after(self.render_poll_interval, self._poll_thumbnails)
+
+    def export_trace(self, file_path):
+        if not self.profiler:
+            print("[WARN] Profiling is off; enable it before exporting a trace.")
+            return
+        try: self.profile_graph().save_trace(file_path)
+        except OSError as e: print(f"[ERROR] Could not save trace {file_path}: {e}")
+
+    def save_graph(self, file_path):
+        try: graph_file.save_graph(self, file_path)
+        except OSError as e: print(f"[ERROR] Could not save graph {file_path}: {e}")
+
     def on_canvas_press(self, event):
         self.canvas.focus_set()
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        x, y = self.to_model(event.x, event.y)
 
-        clicked_on_node = None
-        for node in reversed(self.nodes): 
-            if node.is_within(canvas_x, canvas_y):
-                if hasattr(node, 'on_element_click') and node.on_element_click(canvas_x, canvas_y): return
-                if node.is_over_connector(canvas_x, canvas_y):
-                     self.on_connector_press(event, node, canvas_x, canvas_y)
-                     return
-                clicked_on_node = node
-                break
+        clicked_on_node = self.find_node_at(x, y)
+        if clicked_on_node:
+            if hasattr(clicked_on_node, 'on_element_click') and clicked_on_node.on_element_click(x, y): return
+            if clicked_on_node.is_over_connector(x, y):
+                 self.on_connector_press(event, clicked_on_node, x, y)
+                 return
 
         if clicked_on_node: clicked_on_node.on_press(event)
         else:
@@ -113,7 +182,7 @@ class NodeGraph:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        if self.linking_in_progress: self.canvas.coords(self.temporary_link_line, self.link_start_pos[0], self.link_start_pos[1], canvas_x, canvas_y)
+        if self.linking_in_progress: self.canvas.coords(self.temporary_link_line, *self.to_canvas(*self.link_start_pos), canvas_x, canvas_y)
         elif self.selected_node: self.selected_node.on_drag(event)
              
     def on_canvas_release(self, event):
@@ -135,6 +204,7 @@ class NodeGraph:
             self.canvas.yview_scroll(int(-sensitive_dy), "units")
             self.last_drag_x = event.x
             self.last_drag_y = event.y
+            self.update_viewport()
 
     def on_canvas_pan_release(self, event):
         self.drag_canvas = False
@@ -142,9 +212,8 @@ class NodeGraph:
 
     def on_canvas_context_menu(self, event):
         menu = tk.Menu(self.canvas, tearoff=0)
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
-        for node_type in self.node_classes: menu.add_command(label=f"Add {node_type}", command=lambda nt=node_type: self.add_node(nt, canvas_x, canvas_y))
+        x, y = self.to_model(event.x, event.y)
+        for node_type in self.node_classes: menu.add_command(label=f"Add {node_type}", command=lambda nt=node_type: self.add_node(nt, x, y))
         if self.selected_node:
             menu.add_separator()
             menu.add_command(label=f"Delete {self.selected_node.node_type}", command=self.delete_selected)
@@ -158,47 +227,71 @@ class NodeGraph:
         elif hasattr(event, 'delta') and event.delta != 0: delta = event.delta
         else: return
 
-        factor = scale_factor if delta > 0 else 1 / scale_factor
+        new_zoom = self.zoom * scale_factor if delta > 0 else self.zoom / scale_factor
+        new_zoom = min(self.max_zoom, max(self.min_zoom, new_zoom))
+        if new_zoom == self.zoom: return
+        factor = new_zoom / self.zoom
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
-        self.canvas.scale("all", canvas_x, canvas_y, factor, factor)
+        self.zoom = new_zoom
+        self.canvas.scale("link", 0, 0, factor, factor)
+        self.canvas.scan_mark(0, 0)
+        self.canvas.scan_dragto(round(canvas_x - canvas_x * factor), round(canvas_y - canvas_y * factor), gain=1)
+        for node in self.realized_nodes: node.undraw()
+        self.realized_nodes = set()
+        self.update_viewport()
+
+    def to_model(self, event_x, event_y): return self.canvas.canvasx(event_x) / self.zoom, self.canvas.canvasy(event_y) / self.zoom
+
+    def to_canvas(self, x, y): return x * self.zoom, y * self.zoom
+
+    def get_viewport(self):
+        x1, y1 = self.to_model(0, 0)
+        x2, y2 = self.to_model(self.canvas.winfo_width(), self.canvas.winfo_height())
+        margin = self.viewport_margin / self.zoom
+        return (x1 - margin, y1 - margin, x2 + margin, y2 + margin)
+
+    def get_lod(self): return "full" if self.zoom >= self.detail_zoom else "simple"
+
+    def update_viewport(self):
+        lod = self.get_lod()
+        visible = self.node_index.query_rect(self.get_viewport())
+        if self.selected_node and self.selected_node not in visible: visible.append(self.selected_node)
+        visible_set = set(visible)
+        for node in self.realized_nodes - visible_set: node.undraw()
+        for node in reversed(visible): node.realize(lod)
+        self.realized_nodes = visible_set
+        self.update_thumbnails()
+
+    def find_node_at(self, x, y):
+        for node in self.node_index.query_point(x, y):
+            if node.is_within(x, y): return node
+        return None
 
     def on_double_click(self, event):
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
-        for node in reversed(self.nodes):
-            if node.is_within(canvas_x, canvas_y): break
+        x, y = self.to_model(event.x, event.y)
+        self.find_node_at(x, y)
 
-    def on_connector_press(self, event, node, canvas_x, canvas_y):
-        connector_type = node.get_connector_type(canvas_x, canvas_y)
+    def on_connector_press(self, event, node, x, y):
+        connector_type = node.get_connector_type(x, y)
         if connector_type == "output":
             self.linking_in_progress = True
             self.link_start_node = node
             self.link_start_pos = node.get_output_pos()
-            self.temporary_link_line = self.canvas.create_line(self.link_start_pos[0], self.link_start_pos[1], canvas_x, canvas_y,fill="cyan", width=2, dash=(4, 4), tags="temp_link")
+            self.temporary_link_line = self.canvas.create_line(*self.to_canvas(*self.link_start_pos), *self.to_canvas(x, y),fill="cyan", width=2, dash=(4, 4), tags="temp_link")
             self.canvas.lift(self.temporary_link_line)
         elif connector_type == "input":
-             if node.input_node:
-                 existing_link = self.find_link(node.input_node, node)
-                 if existing_link: self.remove_link(existing_link) 
-                 node.disconnect_input() 
+             if node.input_node: self.disconnect(node.input_node, node)
 
     def on_link_release(self, event):
         if not self.linking_in_progress: return
 
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        x, y = self.to_model(event.x, event.y)
         link_completed = False
 
-        for target_node in self.nodes:
-            if target_node != self.link_start_node and target_node.input_hit(canvas_x, canvas_y):
-                if target_node.input_node:
-                     old_source_node = target_node.input_node
-                     existing_link = self.find_link(old_source_node, target_node)
-                     if existing_link: self.remove_link(existing_link) 
-                     target_node.disconnect_input() 
-
-                self.add_link(self.link_start_node, target_node) 
+        for target_node in self.node_index.query_point(x, y):
+            if target_node != self.link_start_node and target_node.input_hit(x, y):
+                self.connect(self.link_start_node, target_node) 
                 link_completed = True
                 break
 
@@ -214,64 +307,65 @@ class NodeGraph:
     def add_link(self, start_node, end_node):
         if self.find_link(start_node, end_node): return
 
-        x1, y1 = start_node.get_output_pos()
-        x2, y2 = end_node.get_input_pos()
+        x1, y1 = self.to_canvas(*start_node.get_output_pos())
+        x2, y2 = self.to_canvas(*end_node.get_input_pos())
         line_id = self.canvas.create_line(x1, y1, x2, y2, fill="#a0a0a0", width=2, tags="link")
         link_data = (start_node, end_node, line_id)
-        self.links.append(link_data)
-        start_node.connect_output(end_node)
+        self.links_by_source.setdefault(start_node, {})[end_node] = link_data
+        self.links_by_target.setdefault(end_node, {})[start_node] = link_data
         
     def remove_link(self, link_data):
          start_node, end_node, line_id = link_data
          self.canvas.delete(line_id)
-         if link_data in self.links: self.links.remove(link_data)
+         if self.find_link(start_node, end_node) is link_data:
+             del self.links_by_source[start_node][end_node]
+             del self.links_by_target[end_node][start_node]
+         self.scheduler.remove_edge(start_node, end_node)
 
-    def find_link(self, start_node, end_node):
-         for link in self.links:
-             if link[0] == start_node and link[1] == end_node: return link
-         return None
+    def connect(self, start_node, end_node):
+        super().connect(start_node, end_node)
+        if end_node.input_node is start_node: self.add_link(start_node, end_node)
 
-    def draw_links(self):
-        links_to_remove = []
-        for i, (start, end, line_id) in enumerate(self.links):
-             if start not in self.nodes or end not in self.nodes:
-                 self.canvas.delete(line_id)
-                 links_to_remove.append(self.links[i])
-                 continue
+    def disconnect(self, start_node, end_node):
+        link = self.find_link(start_node, end_node)
+        if link: self.remove_link(link)
+        super().disconnect(start_node, end_node)
 
-             start_pos = start.get_output_pos()
-             end_pos = end.get_input_pos()
-             if start_pos and end_pos:
-                 self.canvas.coords(line_id, start_pos[0], start_pos[1], end_pos[0], end_pos[1])
-                 self.canvas.itemconfig(line_id, state='normal') 
-             else: self.canvas.itemconfig(line_id, state='hidden') 
-        
-        for link in links_to_remove:
-            if link in self.links: self.links.remove(link)
+    def find_link(self, start_node, end_node): return self.links_by_source.get(start_node, {}).get(end_node)
 
+    def get_links(self): return [link for links in self.links_by_source.values() for link in links.values()]
 
-    def update_node_links(self, node):
-        links_to_update = []
-        if node.input_node:
-            link = self.find_link(node.input_node, node)
-            if link: links_to_update.append(link)
-        
-        for target_node in node.output_nodes:
-             link = self.find_link(node, target_node)
-             if link: links_to_update.append(link)
+    def get_node_links(self, node): return list(self.links_by_target.get(node, {}).values()) + list(self.links_by_source.get(node, {}).values())
 
-        for start, end, line_id in links_to_update:
+    def draw_links(self):
+        for node in self.nodes:
+            if self.link_positions.get(node) != (node.x, node.y): self.update_node_links(node)
+
+
+    def update_node_links(self, node):
+        self.scheduler.invalidate()
+        self.link_positions[node] = (node.x, node.y)
+        for start, end, line_id in self.get_node_links(node):
              start_pos = start.get_output_pos()
              end_pos = end.get_input_pos()
              if start_pos and end_pos:
-                 self.canvas.coords(line_id, start_pos[0], start_pos[1], end_pos[0], end_pos[1])
+                 self.canvas.coords(line_id, *self.to_canvas(*start_pos), *self.to_canvas(*end_pos))
                  self.canvas.itemconfig(line_id, state='normal')
              else: self.canvas.itemconfig(line_id, state='hidden')
 
-    def request_update(self):
+    def request_update(self, interactive=False):
          self.needs_update = True
+         if interactive:
+             self.interacting = True
+             if self.refine_scheduled_id: self.master.after_cancel(self.refine_scheduled_id)
+             self.refine_scheduled_id = self.master.after(int(self.refine_delay * 1000), self._refine_full_resolution)
          self.schedule_update()
 
+    def _refine_full_resolution(self):
+         self.refine_scheduled_id = None
+         self.interacting = False
+         self.request_update()
+
     def schedule_update(self):
          if self.update_scheduled_id:
              try: self.master.after_cancel(self.update_scheduled_id)
@@ -283,66 +377,71 @@ class NodeGraph:
          self.update_scheduled_id = None
          if self.needs_update: 
             self.needs_update = False
-            self.process_graph() 
+            execution_order = self.get_execution_order()
+            scale = self.get_proxy_scale() if self.interacting or self.has_huge_inputs() else 1.0
+            preview_scale = None
+            if scale == 1.0 and any(not node.is_decoded() for node in self.nodes if isinstance(node, InputNode)): preview_scale = self.get_proxy_scale()
+            self.render_worker.submit(lambda generation: self._render_in_background(generation, execution_order, scale, preview_scale))
+            self._schedule_render_poll()
          else: pass
 
-    def process_graph(self):
-        execution_order = self.get_execution_order()
-        if execution_order is None:
-            print("[ERROR] Cyclic dependency detected in the graph. Cannot process.")
-            if self.preview_window: self.preview_window.update_image(None) ; return
-        
-        processed_count = 0
-        for node in execution_order:
-             try:
-                node.process() 
-                processed_count += 1
-             except Exception as e: print(f"[ERROR] Failed to process node {node.node_type}: {e}")
-        
-        final_output_image = None
-        output_nodes_in_order = [node for node in execution_order if isinstance(node, OutputNode)]
-        if output_nodes_in_order: final_output_image = output_nodes_in_order[0].output_data
-        else:
-            all_output_nodes = [node for node in self.nodes if isinstance(node, OutputNode)]
-            if all_output_nodes: final_output_image = all_output_nodes[0].output_data
-                 
-        if self.preview_window: self.preview_window.update_image(final_output_image)
-        self.draw_links()
+    def get_proxy_scale(self):
+        if not self.preview_window: return 1.0
+        canvas_width = self.preview_window.canvas.winfo_width()
+        canvas_height = self.preview_window.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1: return 1.0
 
+        input_sizes = [node.get_source_size() for node in self.nodes if isinstance(node, InputNode) and node.get_source_size()]
+        if not input_sizes: return 1.0
+        largest_width, largest_height = max(input_sizes, key=lambda size: size[0] * size[1])
+        return min(1.0, canvas_width / largest_width, canvas_height / largest_height)
 
-    def get_execution_order(self):
-        graph = {node: set() for node in self.nodes}
-        in_degree = {node: 0 for node in self.nodes}
-        
+    def has_huge_inputs(self):
         for node in self.nodes:
-            if node.input_node: 
-                 source_node = node.input_node
-                 if source_node in graph: 
-                     if node not in graph[source_node]:
-                          graph[source_node].add(node)
-                          in_degree[node] += 1
-        
-        queue = [node for node in self.nodes if in_degree[node] == 0]
-        result = []
-
-        while queue:
-            queue.sort(key=lambda n: (n.y, n.x))
-            node = queue.pop(0)
-            result.append(node)
-            
-            neighbors = []
-            for potential_neighbor in self.nodes:
-                if potential_neighbor.input_node == node: neighbors.append(potential_neighbor)
-            
-            neighbors.sort(key=lambda n: (n.y, n.x))
-
-            for neighbor in neighbors:
-                 in_degree[neighbor] -= 1
-                 if in_degree[neighbor] == 0: queue.append(neighbor)
+            size = node.get_source_size() if isinstance(node, InputNode) else None
+            if size and size[0] * size[1] >= self.tiled_pixel_threshold: return True
+        return False
 
-        
-        if len(result) != len(self.nodes):
-            print("[ERROR] Cycle detected! Processed nodes:", [n.node_type for n in result])
-            return None
+    def _render_in_background(self, generation, execution_order, scale, preview_scale=None):
+        is_cancelled = lambda: self.render_worker.is_stale(generation)
+        final_output_image = None
+        try:
+            if preview_scale and preview_scale < 1.0: self.render_results.put((generation, self.evaluate(execution_order, is_cancelled, preview_scale), False))
+            final_output_image = self.evaluate(execution_order, is_cancelled, scale)
+        finally: self.render_results.put((generation, final_output_image, True))
+
+    def _schedule_render_poll(self):
+        if self.render_poll_id is None: self.render_poll_id = self.master.after(self.render_poll_interval, self._poll_render_results)
+
+    def _poll_render_results(self):
+        self.render_poll_id = None
+        latest_result = None
+        while True:
+            try: result = self.render_results.get_nowait()
+            except queue.Empty: break
+            if not self.render_worker.is_stale(result[0]): latest_result = result
+
+        if latest_result:
+            generation, final_output_image, is_final = latest_result
+            if self.preview_window: self.preview_window.update_image(final_output_image, interactive=self.interacting or not is_final)
+            self.draw_links()
+            self.update_profile_badges()
+            self.update_thumbnails()
+            if is_final: return
+        self._schedule_render_poll()
+
+    def process_graph(self):
+        self.render_worker.cancel()
+        if self.render_poll_id:
+            self.master.after_cancel(self.render_poll_id)
+            self.render_poll_id = None
+        final_output_image = super().process_graph()
+        if self.preview_window: self.preview_window.update_image(final_output_image)
+        self.draw_links()
+        self.update_profile_badges()
+        self.update_thumbnails()
+        return final_output_image
 
-        return result
\ No newline at end of file
+    def render_tiled(self, output_node, on_tile=None):
+        self.render_worker.cancel()
+        return super().render_tiled(output_node, on_tile)
@@ -1,34 +1,37 @@
 import tkinter as tk
+from engine import array_backend
+from engine.node_model import NodeModel
+from PIL import ImageTk
 
 NODE_FONT_NORMAL = ("Segoe UI", 9)
 NODE_FONT_BOLD = ("Segoe UI", 10, "bold")
 NODE_FONT_SMALL = ("Segoe UI", 8)
 
 
-class BaseNode:
-    def __init__(self, node_graph, node_type, x, y):
-        self.node_graph = node_graph
-        self.node_type = node_type
-        self.x = x
-        self.y = y
-        self.width = 150
-        
-        self.height = 120
+def get_heat_color(heat):
+    heat = min(max(heat, 0.0), 1.0)
+    return f"#{int(255 * min(1.0, 2 * heat)):02x}{int(255 * min(1.0, 2 * (1 - heat))):02x}40"
+
+
+class BaseNode(NodeModel):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.title_height = 25
         self.selected = False
         self.id = None 
         self.text_id = None 
+        self.lod = None
         self.ui_elements = {} 
         self.widget_windows = {} 
         self.drag_offset_x = 0
         self.drag_offset_y = 0
-        self.input_data = None
-        self.output_data = None
-        self.input_node = None
-        self.output_nodes = []
         self.input_connector = None
         self.output_connector = None
         self.connector_radius = 6
+        self.thumbnail_size = (self.width - 10, 80)
+        self.thumbnail_version = None
+        self.thumbnail_photo = None
+        self.thumbnail_mode = None
         
         self.node_tag = f"node_{id(self)}"
 
@@ -41,6 +44,15 @@ class BaseNode:
         self.connector_outline = "#222222"
 
     def draw(self):        
+        self.draw_frame()
+        self.draw_controls() 
+        self.draw_thumbnail()
+
+    def draw_simple(self):
+        self.draw_frame()
+        if self.node_graph.zoom < self.node_graph.label_zoom: self.node_graph.canvas.itemconfig(self.text_id, state='hidden')
+
+    def draw_frame(self):
         self.id = self.node_graph.canvas.create_rectangle(
             self.x, self.y, self.x + self.width, self.y + self.height,
             fill=self.node_color, outline=self.outline_color, width=1, tags=("node", self.node_tag))
@@ -67,54 +79,127 @@ class BaseNode:
                 tags=("connector", "output", self.node_tag))
         else: self.output_connector = None
 
-        self.draw_controls() 
+        self.ui_elements['profile_bar'] = self.node_graph.canvas.create_rectangle(self.x, self.y, self.x + self.width, self.y + 4, width=0, state='hidden', tags=(self.node_tag,))
+        self.ui_elements['profile_text'] = self.node_graph.canvas.create_text(self.x + self.width, self.y - 2, anchor=tk.SE, font=NODE_FONT_SMALL, fill="#E0E0E0", state='hidden', tags=(self.node_tag,))
+        self.update_profile()
+
         self.node_graph.canvas.tag_bind(self.node_tag, "<ButtonPress-1>", self.on_press)
         self.node_graph.canvas.tag_bind(self.node_tag, "<B1-Motion>", self.on_drag)
         self.node_graph.canvas.tag_bind(self.node_tag, "<ButtonRelease-1>", self.on_release)
 
-    def draw_controls(self): pass 
+    def draw_controls(self): pass
+
+    def wants_thumbnail(self): return self.node_graph.show_thumbnails
+
+    def get_thumbnail_version(self): return self.output_version
+
+    def get_thumbnail_job(self):
+        point_nodes = []
+        node = self
+        while not array_backend.is_image(node.output_data):
+            if node.dirty or node.input_node is None: return None
+            point_nodes.append(node)
+            node = node.input_node
+        data, size = node.output_data, self.thumbnail_size
+        return lambda renderer: renderer.render(data, size, point_nodes[::-1])
+
+    def get_thumbnail_position(self):
+        x1, y1, x2, y2 = self.node_graph.canvas.coords(self.id)
+        return (x1 + x2) / 2, y2 + 4 * (y2 - y1) / self.height, tk.N
+
+    def draw_thumbnail(self):
+        if self.ui_elements.get('thumbnail'): self.node_graph.canvas.delete(self.ui_elements['thumbnail'])
+        self.ui_elements['thumbnail'] = None
+        if self.thumbnail_photo is None or not self.wants_thumbnail(): return
+        x, y, anchor = self.get_thumbnail_position()
+        self.ui_elements['thumbnail'] = self.node_graph.canvas.create_image(x, y, image=self.thumbnail_photo, anchor=anchor, tags=(self.node_tag, "thumbnail"))
+
+    def set_thumbnail(self, image, version):
+        self.thumbnail_version = version
+        if image is None: self.thumbnail_photo = None
+        elif self.thumbnail_photo and (self.thumbnail_photo.width(), self.thumbnail_photo.height()) == image.size and self.thumbnail_mode == image.mode:
+            self.thumbnail_photo.paste(image)
+            return
+        else:
+            self.thumbnail_photo = ImageTk.PhotoImage(image)
+            self.thumbnail_mode = image.mode
+        if self.lod == "full": self.draw_thumbnail()
+
+    def update_profile(self):
+        bar, text = self.ui_elements.get('profile_bar'), self.ui_elements.get('profile_text')
+        if bar is None: return
+        profiler = self.node_graph.profiler
+        record = profiler.get_record(self) if profiler else None
+        if record is None:
+            self.node_graph.canvas.itemconfig(bar, state='hidden')
+            self.node_graph.canvas.itemconfig(text, state='hidden')
+            return
+
+        label = f"{record['wall_ms']:.1f} ms · {record['output_bytes'] / 1e6:.1f} MB"
+        if record['category'] != "process": label += f" ({record['category']})"
+        self.node_graph.canvas.itemconfig(bar, fill=get_heat_color(profiler.get_heat(self, self.node_graph.nodes)), state='normal')
+        self.node_graph.canvas.itemconfig(text, text=label, state='normal' if self.node_graph.zoom >= self.node_graph.label_zoom else 'hidden') 
+
+    def realize(self, lod):
+        if self.lod == lod: return
+        if self.lod: self.undraw()
+        if lod == "full": self.draw()
+        else: self.draw_simple()
+        zoom = self.node_graph.zoom
+        if zoom != 1.0: self.node_graph.canvas.scale(self.node_tag, 0, 0, zoom, zoom)
+        if self.selected: self.node_graph.canvas.itemconfig(self.id, outline=self.selected_outline_color, width=2)
+        self.lod = lod
+
+    def undraw(self):
+        for key, widget in list(self.ui_elements.items()):
+             if isinstance(widget, tk.Widget): widget.destroy()
+
+        self.node_graph.canvas.delete(self.node_tag)
+        self.ui_elements = {}
+        self.widget_windows = {}
+        self.input_connector = None
+        self.output_connector = None
+        self.id = None
+        self.text_id = None
+        self.lod = None
 
     def get_control_area_start_y(self): return self.y + self.title_height + 5
 
     def on_press(self, event):
-        canvas_x = self.node_graph.canvas.canvasx(event.x)
-        canvas_y = self.node_graph.canvas.canvasy(event.y)
-        clicked_items = self.node_graph.canvas.find_overlapping(canvas_x-1, canvas_y-1, canvas_x+1, canvas_y+1)
-        if not clicked_items or not any(self.node_tag in self.node_graph.canvas.gettags(item) for item in clicked_items): return
-
-        top_item = clicked_items[-1]
-        item_tags = self.node_graph.canvas.gettags(top_item)
+        x, y = self.node_graph.to_model(event.x, event.y)
+        if self.node_graph.find_node_at(x, y) is not self: return
 
-        if "connector" in item_tags and self.node_tag in item_tags:
-            if self.is_over_connector(canvas_x, canvas_y):
-                self.node_graph.on_connector_press(event, self, canvas_x, canvas_y)
-                return
+        if self.is_over_connector(x, y):
+            self.node_graph.on_connector_press(event, self, x, y)
+            return
 
+        canvas_x = self.node_graph.canvas.canvasx(event.x)
+        canvas_y = self.node_graph.canvas.canvasy(event.y)
         is_widget_window = False
-        try:
-            if self.node_graph.canvas.itemcget(top_item, 'window') and self.node_tag in item_tags: is_widget_window = True
-        except tk.TclError: pass
+        for window_id in self.widget_windows.values():
+            try: bbox = self.node_graph.canvas.bbox(window_id)
+            except tk.TclError: continue
+            if bbox and bbox[0] <= canvas_x <= bbox[2] and bbox[1] <= canvas_y <= bbox[3]: is_widget_window = True
 
         if is_widget_window: return 
         self.node_graph.select_node(self) 
-        self.drag_offset_x = canvas_x - self.x
-        self.drag_offset_y = canvas_y - self.y
+        self.drag_offset_x = x - self.x
+        self.drag_offset_y = y - self.y
         self.node_graph.canvas.lift(self.node_tag)
 
 
     def on_drag(self, event):
         if self.selected:
-            canvas_x = self.node_graph.canvas.canvasx(event.x)
-            canvas_y = self.node_graph.canvas.canvasy(event.y)
-            new_x = canvas_x - self.drag_offset_x
-            new_y = canvas_y - self.drag_offset_y
+            x, y = self.node_graph.to_model(event.x, event.y)
+            new_x = x - self.drag_offset_x
+            new_y = y - self.drag_offset_y
             dx = new_x - self.x
             dy = new_y - self.y
 
-            self.node_graph.canvas.move(self.node_tag, dx, dy)
+            self.node_graph.canvas.move(self.node_tag, dx * self.node_graph.zoom, dy * self.node_graph.zoom)
             self.x = new_x
             self.y = new_y
-            self.update_ui_element_positions()
+            self.node_graph.node_index.update(self, self.get_bounds())
             self.node_graph.update_node_links(self)
 
     def on_release(self, event):
@@ -125,16 +210,20 @@ class BaseNode:
     def select(self):
          if not self.selected:
              self.selected = True
-             self.node_graph.canvas.itemconfig(self.id, outline=self.selected_outline_color, width=2)
+             if self.id: self.node_graph.canvas.itemconfig(self.id, outline=self.selected_outline_color, width=2)
 
     def deselect(self):
         if self.selected:
             self.selected = False
-            self.node_graph.canvas.itemconfig(self.id, outline=self.outline_color, width=1)
+            if self.id: self.node_graph.canvas.itemconfig(self.id, outline=self.outline_color, width=1)
     
-    def is_within(self, x, y):
+    def get_bounds(self):
         margin = self.connector_radius
-        return (self.x - margin <= x <= self.x + self.width + margin and self.y - margin <= y <= self.y + self.height + margin)
+        return (self.x - margin, self.y - margin, self.x + self.width + margin, self.y + self.height + margin)
+
+    def is_within(self, x, y):
+        x1, y1, x2, y2 = self.get_bounds()
+        return x1 <= x <= x2 and y1 <= y <= y2
 
     def is_over_connector(self, x, y): return self.input_hit(x, y) or self.output_hit(x, y)
 
@@ -159,50 +248,7 @@ class BaseNode:
 
     def get_output_pos(self): return self.x + self.width, self.y + self.title_height + (self.height - self.title_height) / 2
 
-    def connect_input(self, source_node):
-        self.disconnect_input() 
-        self.input_node = source_node
-        if self not in source_node.output_nodes: source_node.output_nodes.append(self)
-        self.node_graph.needs_update = True
-
-    def connect_output(self, target_node): target_node.connect_input(self) 
-
-    def disconnect_input(self):
-        if self.input_node:
-            source_node = self.input_node 
-            self.input_node = None
-            self.input_data = None
-            if self in source_node.output_nodes: source_node.output_nodes.remove(self)
-            self.node_graph.needs_update = True
-
-    def disconnect_output(self, target_node):
-         if target_node in self.output_nodes:
-             if target_node.input_node == self: target_node.disconnect_input() 
-
-    def disconnect_all(self):
-        self.disconnect_input()
-        outputs_to_disconnect = list(self.output_nodes)
-        for node in outputs_to_disconnect:
-            if node.input_node == self: node.disconnect_input()
-        self.output_nodes = []
-
-
     def delete(self):
         self.disconnect_all()        
-        for key, widget in list(self.ui_elements.items()):
-             if isinstance(widget, tk.Widget):
-                 widget.destroy()
-                 del self.ui_elements[key]
-
-        self.node_graph.canvas.delete(self.node_tag)
-        self.ui_elements = {}
-        self.widget_windows = {}
-        self.input_connector = None
-        self.output_connector = None
-        self.id = None
-        self.text_id = None
-
-    def process(self):
-        if self.input_node: self.input_data = self.input_node.output_data
-        else: self.input_data = None
-        self.output_data = self.input_data
\ No newline at end of file
+        self.node_graph.node_index.remove(self)
+        self.undraw()
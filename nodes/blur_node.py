@@ -1,13 +1,8 @@
 import tkinter as tk
 from nodes.base_node import BaseNode
-from PIL import ImageFilter, Image
-
-class BlurNode(BaseNode):
-    def __init__(self, node_graph, x, y):
-        super().__init__(node_graph, "Blur", x, y)
-        self.blur_radius = 0.0
-        self.height = 130 
+from engine.blur_model import BlurModel
 
+class BlurNode(BaseNode, BlurModel):
     def draw_controls(self):
         super().draw_controls()
         control_y = self.get_control_area_start_y()
@@ -21,7 +16,7 @@ class BlurNode(BaseNode):
         self.widget_windows['blur_label'] = label_window_id
         
         slider_y = control_y + label_height_estimate
-        slider = tk.Scale(self.node_graph.canvas, from_=0.0, to=10.0, resolution=0.1,orient=tk.HORIZONTAL, length=widget_width, sliderlength=15, width=10,command=self._update_blur, bg="#e0e0e0", troughcolor="#cccccc",highlightthickness=0, showvalue=False)
+        slider = tk.Scale(self.node_graph.canvas, from_=0.0, to=200.0, resolution=0.5,orient=tk.HORIZONTAL, length=widget_width, sliderlength=15, width=10,command=self._update_blur, bg="#e0e0e0", troughcolor="#cccccc",highlightthickness=0, showvalue=False)
         slider.set(self.blur_radius)
         self.ui_elements['blur_slider_widget'] = slider
         slider_window_id = self.node_graph.canvas.create_window(widget_x, slider_y, width=widget_width, anchor=tk.NW, window=slider,tags=(self.node_tag,))
@@ -40,18 +35,6 @@ class BlurNode(BaseNode):
             if abs(self.blur_radius - new_radius) > 1e-6: 
                 self.blur_radius = new_radius
                 if hasattr(self, 'blur_value_var'): self.blur_value_var.set(f"{self.blur_radius:.1f}")
-                self.node_graph.request_update()
+                self.mark_dirty()
+                self.node_graph.request_update(interactive=True)
         except ValueError: print(f"[ERROR] Invalid blur slider value: {value_str}")
-
-    def process(self):
-        super().process() 
-        if self.input_data and isinstance(self.input_data, Image.Image):
-            if self.blur_radius > 1e-6: 
-                try:
-                    image_copy = self.input_data.copy()
-                    radius = max(0, self.blur_radius)
-                    self.output_data = image_copy.filter(ImageFilter.GaussianBlur(radius=radius))
-                    
-                except Exception as e: self.output_data = self.input_data 
-            else: self.output_data = self.input_data
-        else: self.output_data = None
\ No newline at end of file
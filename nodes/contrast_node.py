@@ -1,13 +1,8 @@
 import tkinter as tk
 from nodes.base_node import BaseNode
-from PIL import ImageEnhance, Image
-
-class ContrastNode(BaseNode):
-    def __init__(self, node_graph, x, y):
-        super().__init__(node_graph, "Contrast", x, y)
-        self.contrast_factor = 1.0
-        self.height = 130 
+from engine.contrast_model import ContrastModel
 
+class ContrastNode(BaseNode, ContrastModel):
     def draw_controls(self):
         super().draw_controls()
         control_y = self.get_control_area_start_y()
@@ -40,16 +35,6 @@ class ContrastNode(BaseNode):
             if abs(self.contrast_factor - new_factor) > 1e-6: 
                 self.contrast_factor = new_factor
                 if hasattr(self, 'contrast_value_var'):self.contrast_value_var.set(f"{self.contrast_factor:.2f}")
-                self.node_graph.request_update()
+                self.mark_dirty()
+                self.node_graph.request_update(interactive=True)
         except ValueError: print(f"[ERROR] Invalid contrast slider value: {value_str}")
-
-    def process(self):
-        super().process() 
-        if self.input_data and isinstance(self.input_data, Image.Image):
-            try:
-                image_copy = self.input_data.copy()
-                enhancer = ImageEnhance.Contrast(image_copy)
-                self.output_data = enhancer.enhance(self.contrast_factor)
-                
-            except Exception as e:self.output_data = self.input_data 
-        else: self.output_data = None
\ No newline at end of file
@@ -0,0 +1,46 @@
+import os
+from tkinter import filedialog, simpledialog
+from nodes.input_node import InputNode
+from engine import raster_source
+from engine.raster_input_model import RasterInputModel
+
+class RasterInputNode(InputNode, RasterInputModel):
+    def ask_load_image(self):
+        file_path = filedialog.askopenfilename(title="Select a Raster",filetypes=[("Raster Files", "*.npy;*.tif;*.tiff;*.raw;*.bin"), ("All Files", "*.*")])
+        if not file_path: return
+        if os.path.splitext(file_path)[1].lower() in raster_source.RAW_EXTENSIONS and not self.ask_raw_layout(): return
+        self.load_image(file_path)
+
+    def ask_raw_layout(self):
+        layout = simpledialog.askstring("Raw Layout", "Width Height [dtype] [channels] [offset], e.g. 8192 4096 u2 1 0:", initialvalue=f"{self.raw_width} {self.raw_height} {self.raw_dtype} {self.raw_channels} {self.raw_offset}")
+        if not layout: return False
+        fields = layout.split()
+        try:
+            self.raw_width, self.raw_height = int(fields[0]), int(fields[1])
+            if len(fields) > 2: self.raw_dtype = fields[2]
+            if len(fields) > 3: self.raw_channels = int(fields[3])
+            if len(fields) > 4: self.raw_offset = int(fields[4])
+        except (IndexError, ValueError):
+            print(f"[ERROR] Invalid raw layout: {layout}")
+            return False
+        return True
+
+    def ask_value_range(self):
+        low, high = self.get_value_range()
+        value_range = simpledialog.askstring("Value Range", "Min Max mapped to black and white (leave empty to use the range found in the file):", initialvalue=f"{low:g} {high:g}")
+        if value_range is None: return
+        fields = value_range.split()
+        try: value_min, value_max = (float(fields[0]), float(fields[1])) if fields else (None, None)
+        except (IndexError, ValueError):
+            print(f"[ERROR] Invalid value range: {value_range}")
+            return
+        self.set_param('value_min', value_min)
+        self.set_param('value_max', value_max)
+        self.node_graph.update_thumbnails()
+
+    def get_params(self):
+        params = super().get_params()
+        params['value_range'] = {'type': 'button', 'text': 'Set Value Range', 'command': self.ask_value_range}
+        return params
+
+    def get_thumbnail_version(self): return (self.image_path, id(self.raster), self.get_value_range())
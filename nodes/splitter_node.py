@@ -1,15 +1,9 @@
 import tkinter as tk
-from tkinter import ttk 
+from tkinter import ttk
 from nodes.base_node import BaseNode
-from PIL import Image
-
-class SplitterNode(BaseNode):
-    MODES = ["Red", "Green", "Blue", "Alpha", "Gray (R)", "Gray (G)", "Gray (B)", "Gray (A)"]
-    def __init__(self, node_graph, x, y):
-        super().__init__(node_graph, "Color Splitter", x, y)
-        self.output_mode = SplitterNode.MODES[0] 
-        self.height = 130 
+from engine.splitter_model import SplitterModel
 
+class SplitterNode(BaseNode, SplitterModel):
     def draw_controls(self):
         super().draw_controls()
         control_y = self.get_control_area_start_y()
@@ -35,33 +29,5 @@ class SplitterNode(BaseNode):
         if self.output_mode != new_mode:
             self.output_mode = new_mode
             print(f"[PARAM] Splitter mode changed to: {self.output_mode}")
+            self.mark_dirty()
             self.node_graph.request_update()
-
-    def process(self):
-        super().process() 
-        self.output_data = None 
-        if self.input_data and isinstance(self.input_data, Image.Image):
-            try:
-                bands = self.input_data.split()
-                num_bands = len(bands)
-                mode_parts = self.output_mode.split() 
-                target_channel = mode_parts[-1].replace('(', '').replace(')', '') 
-                make_grayscale = "Gray" in mode_parts
-
-                channel_index = -1
-                if target_channel == 'R' and num_bands >= 1: channel_index = 0
-                elif target_channel == 'G' and num_bands >= 2: channel_index = 1
-                elif target_channel == 'B' and num_bands >= 3: channel_index = 2
-                elif target_channel == 'A' and num_bands == 4: channel_index = 3
-                elif target_channel == 'A' and num_bands < 4:
-                    self.output_data = Image.new('L', self.input_data.size, 0)
-                    return 
-                elif channel_index == -1:
-                     self.output_data = Image.new('L', self.input_data.size, 0) 
-                     return 
-                selected_band = bands[channel_index]
-                if make_grayscale:self.output_data = selected_band
-                else: self.output_data = selected_band 
-
-            except Exception as e: self.output_data = None
-        else: self.output_data = None
\ No newline at end of file
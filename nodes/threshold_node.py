@@ -1,16 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
 from nodes.base_node import BaseNode
-from PIL import Image, ImageOps
-
-class ThresholdNode(BaseNode):
-    METHODS = ["Binary"] 
-    def __init__(self, node_graph, x, y):
-        super().__init__(node_graph, "Threshold", x, y)
-        self.threshold_value = 128
-        self.method = ThresholdNode.METHODS[0]
-        self.height = 160 
+from engine.threshold_model import ThresholdModel
 
+class ThresholdNode(BaseNode, ThresholdModel):
     def draw_controls(self):
         super().draw_controls()
         control_y = self.get_control_area_start_y()
@@ -51,11 +44,26 @@ class ThresholdNode(BaseNode):
         self.ui_elements['thresh_value_label_widget'] = value_label
         value_label_window_id = self.node_graph.canvas.create_window(widget_x + widget_width/2, widget_y, anchor=tk.N, window=value_label,tags=(self.node_tag,))
         self.widget_windows['thresh_value_label'] = value_label_window_id        
+        widget_y += label_h
+
+        for name, text, low, high in (('block_size', "Block Size", 3, 255), ('adaptive_offset', "Offset (C)", -50, 50)):
+            value_var = tk.StringVar(value=f"{text}: {getattr(self, name)}")
+            label = tk.Label(self.node_graph.canvas, textvariable=value_var, bg="#e0e0e0", font=("Arial", 8), anchor='w')
+            self.ui_elements[f'{name}_label_widget'] = label
+            self.widget_windows[f'{name}_label'] = self.node_graph.canvas.create_window(widget_x, widget_y, width=widget_width, anchor=tk.NW, window=label,tags=(self.node_tag,))
+            widget_y += label_h
+
+            slider = tk.Scale(self.node_graph.canvas, from_=low, to=high, resolution=1,orient=tk.HORIZONTAL, length=widget_width, sliderlength=15, width=10,command=lambda value_str, name=name, text=text, value_var=value_var: self._update_adaptive(name, text, value_var, value_str), bg="#e0e0e0", troughcolor="#cccccc",highlightthickness=0, showvalue=False)
+            slider.set(getattr(self, name))
+            self.ui_elements[f'{name}_slider_widget'] = slider
+            self.widget_windows[f'{name}_slider'] = self.node_graph.canvas.create_window(widget_x, widget_y, width=widget_width, anchor=tk.NW, window=slider,tags=(self.node_tag,))
+            widget_y += 25
 
     def _update_method(self, event=None):
         new_method = self.method_var.get()
         if self.method != new_method:
             self.method = new_method
+            self.mark_dirty()
             self.node_graph.request_update()
 
     def _update_threshold(self, value_str):
@@ -64,19 +72,17 @@ class ThresholdNode(BaseNode):
             if self.threshold_value != new_value:
                 self.threshold_value = new_value
                 if hasattr(self, 'thresh_value_var'): self.thresh_value_var.set(f"{self.threshold_value}")
-                self.node_graph.request_update()
+                self.mark_dirty()
+                self.node_graph.request_update(interactive=True)
         except ValueError: print(f"[ERROR] Invalid threshold slider value: {value_str}")
 
-    def process(self):
-        super().process() 
-        self.output_data = None
-
-        if self.input_data and isinstance(self.input_data, Image.Image):
-            try:
-                img_gray = ImageOps.grayscale(self.input_data)
-                if self.method == "Binary":
-                    self.output_data = img_gray.point(lambda p: 255 if p > self.threshold_value else 0, mode='1') 
-                    self.output_data = self.output_data.convert('L')
-                else:self.output_data = img_gray 
-            except Exception as e:self.output_data = None
-        else: self.output_data = None
\ No newline at end of file
+    def _update_adaptive(self, name, text, value_var, value_str):
+        try:
+            new_value = int(float(value_str))
+            if name == 'block_size': new_value |= 1
+            if getattr(self, name) != new_value:
+                setattr(self, name, new_value)
+                value_var.set(f"{text}: {new_value}")
+                self.mark_dirty()
+                self.node_graph.request_update(interactive=True)
+        except ValueError: print(f"[ERROR] Invalid {text.lower()} slider value: {value_str}")
@@ -0,0 +1,36 @@
+import threading
+from engine.graph_engine import RenderCancelled
+
+
+class RenderWorker:
+    def __init__(self):
+        self.generation = 0
+        self._pending_job = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="RenderWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, job):
+        with self._condition:
+            self.generation += 1
+            self._pending_job = (self.generation, job)
+            self._condition.notify()
+            return self.generation
+
+    def cancel(self):
+        with self._condition:
+            self.generation += 1
+            self._pending_job = None
+
+    def is_stale(self, generation): return generation != self.generation
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending_job is None: self._condition.wait()
+                generation, job = self._pending_job
+                self._pending_job = None
+
+            try: job(generation)
+            except RenderCancelled: pass
+            except Exception as e: print(f"[ERROR] Render job failed: {e}")
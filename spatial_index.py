@@ -0,0 +1,73 @@
+import math
+
+DEFAULT_CELL_SIZE = 256
+
+
+class SpatialIndex:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.item_bounds = {}
+        self.item_cells = {}
+        self.item_order = {}
+        self.next_order = 0
+
+    def get_cell_range(self, bounds):
+        x1, y1, x2, y2 = bounds
+        return range(math.floor(x1 / self.cell_size), math.floor(x2 / self.cell_size) + 1), range(math.floor(y1 / self.cell_size), math.floor(y2 / self.cell_size) + 1)
+
+    def insert(self, item, bounds):
+        if item in self.item_bounds: return self.update(item, bounds)
+        self.item_order[item] = self.next_order
+        self.next_order += 1
+        self._store(item, bounds)
+
+    def update(self, item, bounds):
+        if item not in self.item_bounds: return self.insert(item, bounds)
+        if self.item_bounds[item] == bounds: return
+        old_cells = self.item_cells[item]
+        columns, rows = self.get_cell_range(bounds)
+        if old_cells == (columns, rows):
+            self.item_bounds[item] = bounds
+            return
+        self._discard(item)
+        self._store(item, bounds)
+
+    def remove(self, item):
+        if item not in self.item_bounds: return
+        self._discard(item)
+        del self.item_order[item]
+
+    def _store(self, item, bounds):
+        columns, rows = self.get_cell_range(bounds)
+        for column in columns:
+            for row in rows: self.cells.setdefault((column, row), set()).add(item)
+        self.item_bounds[item] = bounds
+        self.item_cells[item] = (columns, rows)
+
+    def _discard(self, item):
+        columns, rows = self.item_cells.pop(item)
+        for column in columns:
+            for row in rows:
+                cell = self.cells[(column, row)]
+                cell.discard(item)
+                if not cell: del self.cells[(column, row)]
+        del self.item_bounds[item]
+
+    def query_point(self, x, y):
+        cell = self.cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)), ())
+        hits = [item for item in cell if self._contains(self.item_bounds[item], x, y)]
+        return sorted(hits, key=self.item_order.get, reverse=True)
+
+    def query_rect(self, bounds):
+        columns, rows = self.get_cell_range(bounds)
+        found = set()
+        for column in columns:
+            for row in rows: found.update(self.cells.get((column, row), ()))
+        x1, y1, x2, y2 = bounds
+        hits = [item for item in found if self._overlaps(self.item_bounds[item], x1, y1, x2, y2)]
+        return sorted(hits, key=self.item_order.get, reverse=True)
+
+    def _contains(self, bounds, x, y): return bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+
+    def _overlaps(self, bounds, x1, y1, x2, y2): return bounds[0] <= x2 and x1 <= bounds[2] and bounds[1] <= y2 and y1 <= bounds[3]
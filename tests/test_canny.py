@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from benchmarks.canny import make_photo, make_uniform_noise, reference_canny
+from engine import array_backend
+
+
+@pytest.mark.parametrize("noise", [0, 6, 12])
+@pytest.mark.parametrize("low, high", [(50, 150), (20, 60), (150, 50)])
+def test_canny_matches_reference(noise, low, high):
+    gray = make_photo(0.3, noise)
+    assert np.array_equal(array_backend.canny(gray, low, high), reference_canny(gray, low, high))
+
+
+def test_canny_matches_reference_on_dense_noise():
+    gray = make_uniform_noise(0.3)
+    for low, high in ((50, 150), (300, 600)): assert np.array_equal(array_backend.canny(gray, low, high), reference_canny(gray, low, high))
+
+
+def test_canny_on_flat_and_tiny_images():
+    assert not array_backend.canny(np.full((40, 30), 128, dtype=np.uint8), 50, 150).any()
+    assert array_backend.canny(np.zeros((1, 1), dtype=np.uint8), 50, 150).shape == (1, 1)
@@ -0,0 +1,31 @@
+import os
+from PIL import Image
+from engine.disk_cache import DiskCache
+
+
+def test_entries_are_compressed_and_survive_reopening(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    image = Image.linear_gradient("L").resize((512, 384)).convert("RGB")
+    cache.put("gradient", image)
+    assert cache.contains("gradient") and cache.get("gradient").tobytes() == image.tobytes()
+    cache.flush()
+    assert not cache.pending and os.path.getsize(cache.get_path("gradient")) < len(image.tobytes()) // 4
+
+    reopened = DiskCache(str(tmp_path))
+    assert reopened.contains("gradient") and reopened.get("gradient").tobytes() == image.tobytes()
+
+
+def test_uncompressed_entries_from_older_versions_still_load(tmp_path):
+    image = Image.new("L", (8, 4), 77)
+    with open(tmp_path / "old.img", "wb") as f:
+        f.write(b"L 8 4\n")
+        f.write(image.tobytes())
+    assert DiskCache(str(tmp_path)).get("old").tobytes() == image.tobytes()
+
+
+def test_oversized_entries_are_skipped(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=8 * 1024)
+    cache.put("large", Image.new("RGB", (64, 64)))
+    cache.put("small", Image.new("L", (16, 16)))
+    cache.flush()
+    assert not cache.contains("large") and cache.contains("small")
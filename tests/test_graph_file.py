@@ -0,0 +1,40 @@
+import os
+from PIL import Image
+from engine.graph_engine import GraphEngine
+from engine.graph_file import load_graph, save_graph
+
+
+def make_graph(image_path):
+    engine = GraphEngine()
+    source, blur, output = engine.add_node("Input"), engine.add_node("Blur", params={"blur_radius": 2.0}), engine.add_node("Output")
+    assert source.load_image(image_path)
+    engine.connect(source, blur)
+    engine.connect(blur, output)
+    return engine
+
+
+def test_relative_image_path_survives_save_from_another_directory(tmp_path, monkeypatch):
+    Image.new("RGB", (64, 48), (200, 100, 50)).save(tmp_path / "in.png")
+    (tmp_path / "sub").mkdir()
+    monkeypatch.chdir(tmp_path)
+    engine = make_graph("in.png")
+    expected = engine.process_graph()
+    save_graph(engine, os.path.join("sub", "g.json"))
+
+    monkeypatch.chdir(tmp_path / "sub")
+    loaded = load_graph("g.json")
+    result = loaded.process_graph()
+    assert result is not None and result.tobytes() == expected.tobytes()
+
+    monkeypatch.chdir("/")
+    assert load_graph(str(tmp_path / "sub" / "g.json")).process_graph() is not None
+
+
+def test_absolute_image_path_round_trips(tmp_path, monkeypatch):
+    Image.new("L", (32, 32), 80).save(tmp_path / "in.png")
+    monkeypatch.chdir(tmp_path)
+    save_graph(make_graph(str(tmp_path / "in.png")), str(tmp_path / "g.json"))
+    monkeypatch.chdir("/")
+    loaded = load_graph(str(tmp_path / "g.json"))
+    assert loaded.nodes[0].image_path == str(tmp_path / "in.png")
+    assert loaded.process_graph() is not None
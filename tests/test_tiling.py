@@ -0,0 +1,20 @@
+import pytest
+from PIL import Image
+from engine.graph_engine import GraphEngine
+
+
+@pytest.mark.parametrize("radius, grid", [(3.0, 1), (40.0, 8), (90.0, 16)])
+@pytest.mark.parametrize("tile_size", [333, 1024])
+def test_tiled_blur_matches_full_render(tmp_path, radius, grid, tile_size):
+    noise = Image.effect_noise((2001, 1603), 60)
+    Image.merge("RGB", (noise, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT), Image.linear_gradient("L").resize(noise.size))).save(tmp_path / "in.png")
+    engine = GraphEngine()
+    source, blur, output = engine.add_node("Input"), engine.add_node("Blur", params={"blur_radius": radius}), engine.add_node("Output")
+    assert source.load_image(str(tmp_path / "in.png"))
+    engine.connect(source, blur)
+    engine.connect(blur, output)
+    assert blur.get_tile_grid(source.get_source_size()) == grid
+
+    expected = engine.process_graph()
+    engine.tile_size = tile_size
+    assert engine.render_tiled(output).tobytes() == expected.tobytes()
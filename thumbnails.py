@@ -0,0 +1,75 @@
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from engine import array_backend
+
+
+class ImagePyramid:
+    def __init__(self, data, min_size):
+        if array_backend.is_array(data):
+            width, height = array_backend.get_size(data)
+            step = max(1, min(width // (16 * min_size[0]), height // (16 * min_size[1])))
+            image = array_backend.to_pil(data[::step, ::step])
+        else: image = data
+        self.levels = [image]
+        while image.width >= 2 * min_size[0] and image.height >= 2 * min_size[1]:
+            image = image.reduce(2)
+            self.levels.append(image)
+        self.levels = self.levels[-3:]
+
+    def get_level(self, size):
+        for level in reversed(self.levels):
+            scale = min(size[0] / level.width, size[1] / level.height)
+            if scale <= 1.0: return level
+        return self.levels[0]
+
+
+def fit_thumbnail(image, size):
+    scale = min(1.0, size[0] / image.width, size[1] / image.height)
+    if scale == 1.0: return image
+    return image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.Resampling.LANCZOS)
+
+
+class ThumbnailRenderer:
+    def __init__(self, min_size=(160, 90), max_workers=2):
+        self.min_size = min_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thumbnail")
+        self.results = queue.Queue()
+        self.pending = set()
+        self.pyramids = {}
+        self.lock = threading.RLock()
+
+    def submit(self, node, version, job):
+        self.pending.add((node, version))
+        self.executor.submit(self._run, node, version, job)
+
+    def is_pending(self, node, version): return (node, version) in self.pending
+
+    def _run(self, node, version, job):
+        try: image = job(self)
+        except Exception as e:
+            print(f"[WARN] Could not render thumbnail for {node.node_type}: {e}")
+            image = None
+        self.results.put((node, version, image))
+
+    def get_pyramid(self, data):
+        key = id(data)
+        with self.lock:
+            entry = self.pyramids.get(key)
+            if entry and entry[0]() is data: return entry[1]
+        pyramid = ImagePyramid(data, self.min_size)
+        with self.lock: self.pyramids[key] = (weakref.ref(data, lambda ref: self._forget(key, ref)), pyramid)
+        return pyramid
+
+    def _forget(self, key, ref):
+        with self.lock:
+            if key in self.pyramids and self.pyramids[key][0] is ref: del self.pyramids[key]
+
+    def render(self, data, size, point_nodes=()):
+        image = self.get_pyramid(data).get_level(size)
+        for node in point_nodes:
+            if node.get_point_mode(image.mode) is None: return None
+            image = node.run_kernel(image)
+        return fit_thumbnail(image, size)
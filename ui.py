@@ -1,22 +1,41 @@
+import weakref
 import tkinter as tk
-from tkinter import ttk 
+from collections import OrderedDict
+from tkinter import ttk, filedialog
 from PIL import Image, ImageTk
 
 
 APP_FONT = ("Segoe UI", 9)
 APP_FONT_BOLD = ("Segoe UI", 10, "bold")
 APP_FONT_SMALL = ("Segoe UI", 8)
+GRAPH_FILE_TYPES = [("Graph Files", "*.json"), ("All Files", "*.*")]
 
 class Toolbar:
     def __init__(self, master):
         self.frame = ttk.Frame(master, relief=tk.FLAT, borderwidth=0)
         self.option_var = tk.StringVar(value="Input")
-        node_types = ["Input", "Output", "Brightness", "Contrast", "Blur", "Splitter", "Threshold", "Edge Detect"]
+        node_types = ["Input", "Raster Input", "Output", "Brightness", "Contrast", "Blur", "Splitter", "Threshold", "Edge Detect"]
         
         self.option_menu = ttk.OptionMenu(self.frame, self.option_var, node_types[0], *node_types)
         self.option_menu.pack(side=tk.LEFT, padx=(5, 2), pady=5)
         self.create_button = ttk.Button(self.frame, text="Create Node", command=self.create_node)
         self.create_button.pack(side=tk.LEFT, padx=(2, 5), pady=5)
+        self.file_frame = ttk.Frame(self.frame)
+        self.file_frame.pack(side=tk.BOTTOM, fill=tk.X, before=self.option_menu)
+        self.open_button = ttk.Button(self.file_frame, text="Open Graph...", command=self.open_graph)
+        self.open_button.pack(side=tk.LEFT, padx=(5, 2), pady=(0, 5))
+        self.save_button = ttk.Button(self.file_frame, text="Save Graph...", command=self.save_graph)
+        self.save_button.pack(side=tk.LEFT, padx=(2, 5), pady=(0, 5))
+        self.profile_frame = ttk.Frame(self.frame)
+        self.profile_frame.pack(side=tk.BOTTOM, fill=tk.X, before=self.file_frame)
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_check = ttk.Checkbutton(self.profile_frame, text="Profile", variable=self.profile_var, command=self.toggle_profiling)
+        self.profile_check.pack(side=tk.LEFT, padx=(5, 2), pady=(0, 5))
+        self.trace_button = ttk.Button(self.profile_frame, text="Export Trace...", command=self.export_trace)
+        self.trace_button.pack(side=tk.LEFT, padx=(2, 5), pady=(0, 5))
+        self.thumbnail_var = tk.BooleanVar(value=True)
+        self.thumbnail_check = ttk.Checkbutton(self.profile_frame, text="Thumbnails", variable=self.thumbnail_var, command=self.toggle_thumbnails)
+        self.thumbnail_check.pack(side=tk.LEFT, padx=(2, 5), pady=(0, 5))
         self.graph = None
 
     def set_node_graph(self, graph): self.graph = graph
@@ -25,6 +44,24 @@ class Toolbar:
         node_type = self.option_var.get()
         if self.graph and node_type: self.graph.add_node(node_type)
 
+    def open_graph(self):
+        file_path = filedialog.askopenfilename(title="Open Graph", filetypes=GRAPH_FILE_TYPES)
+        if self.graph and file_path: self.graph.open_graph(file_path)
+
+    def save_graph(self):
+        file_path = filedialog.asksaveasfilename(title="Save Graph As...", defaultextension=".json", filetypes=GRAPH_FILE_TYPES)
+        if self.graph and file_path: self.graph.save_graph(file_path)
+
+    def toggle_profiling(self):
+        if self.graph: self.graph.set_profiling(self.profile_var.get())
+
+    def toggle_thumbnails(self):
+        if self.graph: self.graph.set_thumbnails(self.thumbnail_var.get())
+
+    def export_trace(self):
+        file_path = filedialog.asksaveasfilename(title="Export Chrome Trace As...", defaultextension=".json", filetypes=[("Trace Event JSON", "*.json"), ("All Files", "*.*")])
+        if self.graph and file_path: self.graph.export_trace(file_path)
+
 class PropertiesPanel:
     def __init__(self, master):
         self.frame = ttk.Frame(master, relief=tk.GROOVE, borderwidth=1, padding=(5, 5))        
@@ -97,11 +134,15 @@ class PropertiesPanel:
         if self.current_node:
             if hasattr(self.current_node, param_name):
                 setattr(self.current_node, param_name, value)
-                if self.graph: self.graph.request_update() 
+                self.current_node.mark_dirty()
+                if self.graph: self.graph.request_update(interactive=True) 
             else: print(f"[WARN] Parameter '{param_name}' not found on node {self.current_node.node_type}")
 
 
 class PreviewWindow:
+    frame_cache_size = 8
+    refine_delay = 150
+
     def __init__(self, master):
         self.frame = ttk.Frame(master, relief=tk.FLAT, borderwidth=0)
         self.frame.pack(fill=tk.BOTH, expand=True)
@@ -114,41 +155,79 @@ class PreviewWindow:
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
         self.image_on_canvas = None
         self.tk_image = None 
-
-    def update_image(self, pil_image):
+        self.current_image = None
+        self.frame_mode = None
+        self.shown_frame = None
+        self.frame_cache = OrderedDict()
+        self.refine_id = None
+        self.canvas.bind("<Configure>", lambda event: self.redraw(interactive=True))
+
+    def update_image(self, pil_image, interactive=False):
+        self.current_image = pil_image
+        self.redraw(interactive)
+
+    def redraw(self, interactive=False):
+        if self.refine_id:
+            self.canvas.after_cancel(self.refine_id)
+            self.refine_id = None
+        self.canvas.delete("message")
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1: return
 
-        self.canvas.delete("all")
-        
-        self.canvas.config(bg=self.canvas_bg)
-        self.image_on_canvas = None
-        self.tk_image = None
-
-        if pil_image is None:
-            self.canvas.after(10, self._draw_no_output_text)
-            return
-
-        if canvas_width <= 1 or canvas_height <= 1:
-            self.canvas.after(100, lambda: self.update_image(pil_image))
+        if self.current_image is None:
+            self.clear_image()
+            self._draw_message("No Output", "white")
             return
 
         try:
-            img_copy = pil_image.copy()
-            img_copy.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-            self.tk_image = ImageTk.PhotoImage(img_copy)
-            self.image_on_canvas = self.canvas.create_image(canvas_width / 2, canvas_height / 2, anchor=tk.CENTER, image=self.tk_image)
-
-        except Exception as e: self.canvas.after(10, self._draw_error_text)
-
-    def _draw_no_output_text(self):
-        if self.image_on_canvas is None:
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            if canvas_width > 1 and canvas_height > 1: self.canvas.create_text(canvas_width/2, canvas_height/2, text="No Output", fill="white", anchor=tk.CENTER, font=APP_FONT)
-
-    def _draw_error_text(self):
-        if self.image_on_canvas is None:
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            if canvas_width > 1 and canvas_height > 1: self.canvas.create_text(canvas_width/2, canvas_height/2, text="Preview Error", fill="#FF8888", anchor=tk.CENTER, font=APP_FONT)
\ No newline at end of file
+            display_image, is_final = self.get_frame(self.current_image, canvas_width, canvas_height, interactive)
+            self.show_frame(display_image, canvas_width, canvas_height)
+            if not is_final: self.refine_id = self.canvas.after(self.refine_delay, self._refine)
+        except Exception as e:
+            print(f"[ERROR] Could not draw the preview: {e}")
+            self.clear_image()
+            self._draw_message("Preview Error", "#FF8888")
+
+    def _refine(self):
+        self.refine_id = None
+        self.redraw()
+
+    def get_frame(self, pil_image, canvas_width, canvas_height, interactive):
+        scale = min(canvas_width / pil_image.width, canvas_height / pil_image.height)
+        if scale >= 1: return pil_image, True
+        display_size = (max(1, round(pil_image.width * scale)), max(1, round(pil_image.height * scale)))
+        key = (id(pil_image), display_size)
+        cached = self.frame_cache.get(key)
+        if cached and cached[0]() is pil_image and (cached[2] or interactive):
+            self.frame_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+        if interactive: display_image = pil_image.resize(display_size, Image.Resampling.BILINEAR, reducing_gap=1.0)
+        else: display_image = pil_image.resize(display_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        self.frame_cache[key] = (weakref.ref(pil_image), display_image, not interactive)
+        self.frame_cache.move_to_end(key)
+        while len(self.frame_cache) > self.frame_cache_size: self.frame_cache.popitem(last=False)
+        return display_image, not interactive
+
+    def show_frame(self, display_image, canvas_width, canvas_height):
+        if self.tk_image and display_image is self.shown_frame: pass
+        elif self.tk_image and self.tk_image.width() == display_image.width and self.tk_image.height() == display_image.height and self.frame_mode == display_image.mode: self.tk_image.paste(display_image)
+        else:
+            self.tk_image = ImageTk.PhotoImage(display_image)
+            self.frame_mode = display_image.mode
+            if self.image_on_canvas: self.canvas.itemconfig(self.image_on_canvas, image=self.tk_image)
+        self.shown_frame = display_image
+        if self.image_on_canvas: self.canvas.coords(self.image_on_canvas, canvas_width / 2, canvas_height / 2)
+        else: self.image_on_canvas = self.canvas.create_image(canvas_width / 2, canvas_height / 2, anchor=tk.CENTER, image=self.tk_image)
+
+    def clear_image(self):
+        if self.image_on_canvas: self.canvas.delete(self.image_on_canvas)
+        self.image_on_canvas = None
+        self.tk_image = None
+        self.shown_frame = None
+
+    def _draw_message(self, text, color):
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        self.canvas.create_text(canvas_width/2, canvas_height/2, text=text, fill=color, anchor=tk.CENTER, font=APP_FONT, tags="message")
\ No newline at end of file